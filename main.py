@@ -1,70 +1,75 @@
-import sys
 import time
+
+_STARTED = time.perf_counter()  # Reference point for the startup measurement
+
+import os
+import sys
+import ast
+import json
+import math
+import mmap
+import importlib
+import pickle
+import shutil
+import hashlib
+import argparse
+import contextlib
+import tempfile
+import threading
+import multiprocessing
+from fractions import Fraction
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QListWidget, QLineEdit, QTextEdit, QPushButton, QLabel, 
-                            QListWidgetItem, QFileDialog, QProgressBar, QSplitter, QFrame)
+                            QListWidgetItem, QFileDialog, QProgressBar, QSplitter, QFrame,
+                            QCheckBox)
 from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QIcon, QTextCursor
-import mpmath as mp
-from mpmath import workprec, iv
 
-mp.dps = 100  # Initial precision
 
-# ======================================================================
-# Calculation Worker Thread
-# ======================================================================
+class _LazyModule:
+    """Module stand-in that imports the real module on first attribute access."""
 
-class CalculationThread(QThread):
-    update_progress = pyqtSignal(int, str)
-    result_ready = pyqtSignal(str, str)
+    def __init__(self, name, optional=False):
+        self._name = name
+        self._optional = optional
+        self._module = None
 
-    def __init__(self, constant_data, precision):
-        super().__init__()
-        self.constant_data = constant_data
-        self.precision = precision
-        self._is_running = True
+    def _load(self):
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self._name)
+            except ImportError:
+                if not self._optional:
+                    raise
+                self._module = False
+        return self._module
 
-    def run(self):
-        try:
-            result = ""
-            formula = ""
-            with workprec(int(self.precision * 1.1)):
-                for progress in self._simulate_calculation():
-                    if not self._is_running:
-                        return
-                    self.update_progress.emit(progress, self.constant_data['formula'])
-                
-                value = self.constant_data['func']()
-                result = mp.nstr(value, self.precision) if isinstance(value, (mp.mpf, iv.mpf)) else str(value)
-                formula = self.constant_data['formula']
-            
-            self.result_ready.emit(result, formula)
-        except Exception as e:
-            self.result_ready.emit(f"⨯ Error: {str(e)}", "")
+    def __bool__(self):
+        # Optional modules are falsy when they are not installed
+        return bool(self._load())
 
-    def _simulate_calculation(self):
-        for i in range(1, 101):
-            time.sleep(0.01)
-            yield i
+    def __getattr__(self, attr):
+        module = self._load()
+        if module is False:
+            raise ImportError(f"{self._name} is not installed")
+        return getattr(module, attr)
 
-    def stop(self):
-        self._is_running = False
 
-# ======================================================================
-# Main Application Window
-# ======================================================================
+# mpmath is only needed once a calculation starts
+mp = _LazyModule('mpmath')
 
-class ConstantsApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.constants = self._load_constants()
-        self.init_ui()
-        self.current_constant = None
-        self.calculation_thread = None
+# mp.dps and flint.ctx.dps are process-wide, so threads of one process take
+# turns evaluating; the CLI runs concurrent jobs in separate processes instead
+PRECISION_LOCK = threading.RLock()
 
+# ======================================================================
+# Constants Registry
+# ======================================================================
 
-    def _load_constants(self):
-        return {
+def load_constants():
+    release = catalog_codata_inputs()[0]  # Labels the entries derived from the CODATA inputs
+    return {
     # Mathematical Constants (1-45)
     "Pi": {
         'func': lambda: mp.pi,
@@ -339,190 +344,190 @@ class ConstantsApp(QMainWindow):
 
     # Physical Constants (46-100)
     "Fine‑Structure Constant": {
-        'func': lambda: mp.mpf('0.0072973525693'),
+        'func': lambda: codata_value("Fine‑Structure Constant"),
         'formula': "α = e²/(4πε₀ℏc)",
-        'accuracy': "0.15 ppb",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Fine‑Structure Constant"),
+        'reference': release
     },
     "Bohr Radius": {
-        'func': lambda: mp.mpf('5.29177210903e-11'),
+        'func': lambda: codata_value("Bohr Radius"),
         'formula': "a₀ = 4πε₀ℏ²/(mₑe²)",
-        'accuracy': "Exact (SI)",
+        'accuracy': codata_accuracy("Bohr Radius"),
         'reference': "NIST Standard"
     },
     "Rydberg Constant": {
-        'func': lambda: mp.mpf('10973731.568160'),
+        'func': lambda: codata_value("Rydberg Constant"),
         'formula': "R_∞ = mₑe⁴/(8ε₀²h³c)",
-        'accuracy': "0.0002 cm⁻¹",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Rydberg Constant"),
+        'reference': release
     },
     "Electron Compton Wavelength": {
-        'func': lambda: mp.mpf('2.42631023867e-12'),
+        'func': lambda: codata_value("Electron Compton Wavelength"),
         'formula': "λ_C = h/(mₑc)",
-        'accuracy': "0.089 ppm",
+        'accuracy': codata_accuracy("Electron Compton Wavelength"),
         'reference': "NIST Standard"
     },
     "Planck Length": {
-        'func': lambda: mp.mpf('1.616255e-35'),
+        'func': lambda: codata_value("Planck Length"),
         'formula': "ℓ_P = √(ℏG/c³)",
-        'accuracy': "0.64 ppm",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Planck Length"),
+        'reference': release
     },
     "Planck Time": {
-        'func': lambda: mp.mpf('5.391247e-44'),
+        'func': lambda: codata_value("Planck Time"),
         'formula': "t_P = √(ℏG/c⁵)",
-        'accuracy': "0.64 ppm",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Planck Time"),
+        'reference': release
     },
     "Planck Mass": {
-        'func': lambda: mp.mpf('2.176434e-8'),
+        'func': lambda: codata_value("Planck Mass"),
         'formula': "m_P = √(ℏc/G)",
-        'accuracy': "0.64 ppm",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Planck Mass"),
+        'reference': release
     },
     "Planck Temperature": {
-        'func': lambda: mp.mpf('1.416784e32'),
+        'func': lambda: codata_value("Planck Temperature"),
         'formula': "T_P = m_Pc²/k_B",
-        'accuracy': "0.64 ppm",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Planck Temperature"),
+        'reference': release
     },
     "Planck Charge": {
-        'func': lambda: mp.mpf('1.875545956e-18'),
+        'func': lambda: codata_value("Planck Charge"),
         'formula': "q_P = √(4πε₀ℏc)",
-        'accuracy': "Exact definition",
+        'accuracy': codata_accuracy("Planck Charge"),
         'reference': "Natural units"
     },
     "Stefan–Boltzmann Constant": {
-        'func': lambda: mp.mpf('5.670374419e-8'),
+        'func': lambda: codata_value("Stefan–Boltzmann Constant"),
         'formula': "σ = 2π⁵k_B⁴/(15h³c²)",
-        'accuracy': "0.035 ppm",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Stefan–Boltzmann Constant"),
+        'reference': release
     },
     "Magnetic Flux Quantum": {
-        'func': lambda: mp.mpf('2.067833848e-15'),
+        'func': lambda: codata_value("Magnetic Flux Quantum"),
         'formula': "Φ₀ = h/(2e)",
-        'accuracy': "Exact (SI)",
+        'accuracy': codata_accuracy("Magnetic Flux Quantum"),
         'reference': "2019 SI"
     },
     "Coulomb’s Constant": {
-        'func': lambda: 1/(4*mp.pi*mp.epsilon0),
+        'func': lambda: codata_value("Coulomb’s Constant"),
         'formula': "k_e = 1/(4πε₀)",
-        'accuracy': "Exact definition",
+        'accuracy': codata_accuracy("Coulomb’s Constant"),
         'reference': "SI units"
     },
     "Boltzmann’s Constant": {
-        'func': lambda: mp.mpf('1.380649e-23'),
+        'func': lambda: codata_value("Boltzmann’s Constant"),
         'formula': "k_B = R/N_A",
-        'accuracy': "Exact (SI)",
+        'accuracy': codata_accuracy("Boltzmann’s Constant"),
         'reference': "2019 SI"
     },
     "Gas Constant": {
-        'func': lambda: mp.mpf('8.314462618'),
+        'func': lambda: codata_value("Gas Constant"),
         'formula': "R = N_A k_B",
-        'accuracy': "Exact (SI)",
+        'accuracy': codata_accuracy("Gas Constant"),
         'reference': "2019 SI"
     },
     "Faraday Constant": {
-        'func': lambda: mp.mpf('96485.33212'),
+        'func': lambda: codata_value("Faraday Constant"),
         'formula': "F = N_A e",
-        'accuracy': "Exact (SI)",
+        'accuracy': codata_accuracy("Faraday Constant"),
         'reference': "2019 SI"
     },
     "Elementary Charge": {
-        'func': lambda: mp.mpf('1.602176634e-19'),
+        'func': lambda: codata_value("Elementary Charge"),
         'formula': "e = 2αh/(μ₀c)",
-        'accuracy': "Exact (SI)",
+        'accuracy': codata_accuracy("Elementary Charge"),
         'reference': "2019 SI"
     },
     "Reduced Planck Constant": {
-        'func': lambda: mp.mpf('1.054571817e-34'),
+        'func': lambda: codata_value("Reduced Planck Constant"),
         'formula': "ℏ = h/(2π)",
-        'accuracy': "Exact (SI)",
+        'accuracy': codata_accuracy("Reduced Planck Constant"),
         'reference': "2019 SI"
     },
     "Gravitational Constant": {
-        'func': lambda: mp.mpf('6.67430e-11'),
+        'func': lambda: codata_value("Gravitational Constant"),
         'formula': "G = F r²/(m₁m₂)",
-        'accuracy': "22 ppm",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Gravitational Constant"),
+        'reference': release
     },
     "Avogadro’s Number": {
-        'func': lambda: mp.mpf('6.02214076e23'),
+        'func': lambda: codata_value("Avogadro’s Number"),
         'formula': "N_A = Fixed value",
-        'accuracy': "Exact",
+        'accuracy': codata_accuracy("Avogadro’s Number"),
         'reference': "2019 SI"
     },
     "Permittivity of Free Space": {
-        'func': lambda: mp.epsilon0,
+        'func': lambda: codata_value("Permittivity of Free Space"),
         'formula': "ε₀ = 1/(μ₀c²)",
-        'accuracy': "Exact definition",
+        'accuracy': codata_accuracy("Permittivity of Free Space"),
         'reference': "SI units"
     },
     "Permeability of Free Space": {
-        'func': lambda: mp.mu0,
-        'formula': "μ₀ = 4π × 10⁻⁷ N/A²",
-        'accuracy': "Exact definition",
+        'func': lambda: codata_value("Permeability of Free Space"),
+        'formula': "μ₀ = 2αh/(e²c)",
+        'accuracy': codata_accuracy("Permeability of Free Space"),
         'reference': "SI units"
     },
     "Wien’s Displacement Constant": {
-        'func': lambda: mp.mpf('2.897771955e-3'),
+        'func': lambda: codata_value("Wien’s Displacement Constant"),
         'formula': "b = hc/(k_B × 4.965114231)",
-        'accuracy': "0.013 ppm",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Wien’s Displacement Constant"),
+        'reference': release
     },
     "Bohr Magneton": {
-        'func': lambda: mp.mpf('9.2740100783e-24'),
+        'func': lambda: codata_value("Bohr Magneton"),
         'formula': "μ_B = eℏ/(2mₑ)",
-        'accuracy': "0.075 ppb",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Bohr Magneton"),
+        'reference': release
     },
     "Nuclear Magneton": {
-        'func': lambda: mp.mpf('5.0507837461e-27'),
+        'func': lambda: codata_value("Nuclear Magneton"),
         'formula': "μ_N = eℏ/(2m_p)",
-        'accuracy': "0.059 ppb",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Nuclear Magneton"),
+        'reference': release
     },
     "Hartree Energy": {
-        'func': lambda: mp.mpf('4.3597447222071e-18'),
+        'func': lambda: codata_value("Hartree Energy"),
         'formula': "E_h = e²/(4πε₀a₀)",
-        'accuracy': "Exact (SI)",
+        'accuracy': codata_accuracy("Hartree Energy"),
         'reference': "2019 SI"
     },
     "Quantum of Circulation": {
-        'func': lambda: mp.mpf('3.6369475516e-4'),
+        'func': lambda: codata_value("Quantum of Circulation"),
         'formula': "h/(2mₑ)",
-        'accuracy': "0.075 ppb",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Quantum of Circulation"),
+        'reference': release
     },
     "von Klitzing Constant": {
-        'func': lambda: mp.mpf('25812.80745'),
+        'func': lambda: codata_value("von Klitzing Constant"),
         'formula': "R_K = h/e²",
-        'accuracy': "Exact (SI)",
+        'accuracy': codata_accuracy("von Klitzing Constant"),
         'reference': "2019 SI"
     },
     "Josephson Constant": {
-        'func': lambda: mp.mpf('483597.8484e9'),
+        'func': lambda: codata_value("Josephson Constant"),
         'formula': "K_J = 2e/h",
-        'accuracy': "Exact (SI)",
+        'accuracy': codata_accuracy("Josephson Constant"),
         'reference': "2019 SI"
     },
     "Thomson Cross Section": {
-        'func': lambda: mp.mpf('6.6524587321e-29'),
+        'func': lambda: codata_value("Thomson Cross Section"),
         'formula': "σ_e = 8πr_e²/3",
-        'accuracy': "0.015 ppm",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Thomson Cross Section"),
+        'reference': release
     },
     "Classical Electron Radius": {
-        'func': lambda: mp.mpf('2.8179403262e-15'),
+        'func': lambda: codata_value("Classical Electron Radius"),
         'formula': "r_e = e²/(4πε₀mₑc²)",
-        'accuracy': "0.015 ppm",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Classical Electron Radius"),
+        'reference': release
     },
     "Proton Compton Wavelength": {
-        'func': lambda: mp.mpf('1.32140985539e-15'),
+        'func': lambda: codata_value("Proton Compton Wavelength"),
         'formula': "λ_p = h/(m_pc)",
-        'accuracy': "0.059 ppb",
-        'reference': "CODATA 2018"
+        'accuracy': codata_accuracy("Proton Compton Wavelength"),
+        'reference': release
     },
     "Proton Gyromagnetic Ratio": {
         'func': lambda: mp.mpf('2.6752218744e8'),
@@ -567,39 +572,39 @@ class ConstantsApp(QMainWindow):
         'reference': "2019 SI"
     },
     "Rydberg Unit of Energy": {
-        'func': lambda: mp.mpf('13.605693122994'),
+        'func': lambda: codata_value("Rydberg Unit of Energy"),
         'formula': "Ry = e²/(8πε₀a₀)",
-        'accuracy': "Exact (SI)",
+        'accuracy': codata_accuracy("Rydberg Unit of Energy"),
         'reference': "2019 SI"
     },
     "Planck Force": {
-        'func': lambda: mp.mpf('1.210256e44'),
+        'func': lambda: codata_value("Planck Force"),
         'formula': "F_P = c⁴/G",
-        'accuracy': "0.64 ppm",
+        'accuracy': codata_accuracy("Planck Force"),
         'reference': "Natural units"
     },
     "Planck Energy": {
-        'func': lambda: mp.mpf('1.956081e9'),
+        'func': lambda: codata_value("Planck Energy"),
         'formula': "E_P = √(ℏc⁵/G)",
-        'accuracy': "0.64 ppm",
+        'accuracy': codata_accuracy("Planck Energy"),
         'reference': "Natural units"
     },
     "Planck Momentum": {
-        'func': lambda: mp.mpf('6.52485e24'),
+        'func': lambda: codata_value("Planck Momentum"),
         'formula': "p_P = E_P/c",
-        'accuracy': "0.64 ppm",
+        'accuracy': codata_accuracy("Planck Momentum"),
         'reference': "Natural units"
     },
     "Planck Area": {
-        'func': lambda: mp.mpf('2.6121e-70'),
+        'func': lambda: codata_value("Planck Area"),
         'formula': "A_P = ℓ_P²",
-        'accuracy': "0.64 ppm",
+        'accuracy': codata_accuracy("Planck Area"),
         'reference': "Natural units"
     },
     "Planck Volume": {
-        'func': lambda: mp.mpf('4.2217e-105'),
+        'func': lambda: codata_value("Planck Volume"),
         'formula': "V_P = ℓ_P³",
-        'accuracy': "0.64 ppm",
+        'accuracy': codata_accuracy("Planck Volume"),
         'reference': "Natural units"
     },
     "Sackur–Tetrode Constant": {
@@ -609,297 +614,3029 @@ class ConstantsApp(QMainWindow):
         'reference': "Statistical mechanics"
     },
     "Planck Power": {
-        'func': lambda: mp.mpf('3.62831e52'),
+        'func': lambda: codata_value("Planck Power"),
         'formula': "P_P = E_P/t_P",
-        'accuracy': "0.64 ppm",
+        'accuracy': codata_accuracy("Planck Power"),
         'reference': "Natural units"
     },
     "Planck Density": {
-        'func': lambda: mp.mpf('5.15500e96'),
+        'func': lambda: codata_value("Planck Density"),
         'formula': "ρ_P = m_P/ℓ_P³",
-        'accuracy': "0.64 ppm",
+        'accuracy': codata_accuracy("Planck Density"),
         'reference': "Natural units"
     },
     "Molar Planck Constant": {
-        'func': lambda: mp.mpf('3.990312712e-10'),
+        'func': lambda: codata_value("Molar Planck Constant"),
         'formula': "N_A h",
-        'accuracy': "Exact (SI)",
+        'accuracy': codata_accuracy("Molar Planck Constant"),
         'reference': "2019 SI"
     },
     "Characteristic Impedance of Free Space": {
-        'func': lambda: mp.sqrt(mp.mu0/mp.epsilon0),
+        'func': lambda: codata_value("Characteristic Impedance of Free Space"),
         'formula': "Z₀ = √(μ₀/ε₀)",
-        'accuracy': "Exact definition",
+        'accuracy': codata_accuracy("Characteristic Impedance of Free Space"),
         'reference': "SI units"
     },
     "Planck Current": {
-        'func': lambda: mp.mpf('3.47897e25'),
+        'func': lambda: codata_value("Planck Current"),
         'formula': "I_P = q_P/t_P",
-        'accuracy': "0.64 ppm",
+        'accuracy': codata_accuracy("Planck Current"),
         'reference': "Natural units"
     },
     "Planck Angular Frequency": {
-        'func': lambda: mp.mpf('1.85487e43'),
+        'func': lambda: codata_value("Planck Angular Frequency"),
         'formula': "ω_P = 1/t_P",
-        'accuracy': "0.64 ppm",
+        'accuracy': codata_accuracy("Planck Angular Frequency"),
         'reference': "Natural units"
     },
     "Planck Acceleration": {
-        'func': lambda: mp.mpf('5.56073e51'),
+        'func': lambda: codata_value("Planck Acceleration"),
         'formula': "a_P = ℓ_P/t_P²",
-        'accuracy': "0.64 ppm",
+        'accuracy': codata_accuracy("Planck Acceleration"),
         'reference': "Natural units"
     },
     "Atomic Unit of Time": {
-        'func': lambda: mp.mpf('2.4188843265857e-17'),
+        'func': lambda: codata_value("Atomic Unit of Time"),
         'formula': "t₀ = ℏ/E_h",
-        'accuracy': "Exact definition",
+        'accuracy': codata_accuracy("Atomic Unit of Time"),
         'reference': "Atomic units"
     },
     "Planck Frequency": {
-        'func': lambda: mp.mpf('1.85487e43'),
+        'func': lambda: codata_value("Planck Frequency"),
         'formula': "ν_P = 1/t_P",
-        'accuracy': "0.64 ppm",
+        'accuracy': codata_accuracy("Planck Frequency"),
         'reference': "Natural units"
     },
     "Atomic Unit of Velocity": {
-        'func': lambda: mp.mpf('2187691.26364'),
+        'func': lambda: codata_value("Atomic Unit of Velocity"),
         'formula': "v₀ = e²/(4πε₀ℏ)",
-        'accuracy': "Exact definition",
+        'accuracy': codata_accuracy("Atomic Unit of Velocity"),
         'reference': "Atomic units"
     }
 }
-    # ==================================================================
-    # UI Initialization
-    # ==================================================================
 
-    def init_ui(self):
-        self.setWindowTitle("Ultimate Math Constants Calculator")
-        self.setWindowIcon(QIcon("math_icon.png"))
-        self.setGeometry(100, 100, 1600, 900)
+# ======================================================================
+# User-Defined Expressions
+# ======================================================================
 
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
+EXPRESSION_MAX_LENGTH = 500
+EXPRESSION_CACHE_SIZE = 64  # Intermediate values kept across evaluations
+EXPRESSION_PREFIX = "ƒ "  # Marks user expressions among catalog names
 
-        # Main layout
-        main_layout = QHBoxLayout(main_widget)
-        main_layout.setContentsMargins(10, 10, 10, 10)
+# Names usable in expressions, mapped to mpmath constants
+EXPRESSION_CONSTANTS = {
+    'pi': 'pi', 'e': 'e', 'euler': 'euler', 'catalan': 'catalan', 'phi': 'phi',
+    'glaisher': 'glaisher', 'khinchin': 'khinchin', 'apery': 'apery', 'mertens': 'mertens',
+    'twinprime': 'twinprime', 'ln2': 'ln2', 'ln10': 'ln10', 'degree': 'degree',
+}
 
-        # Left panel
-        left_panel = QFrame()
-        left_panel.setFrameShape(QFrame.Shape.StyledPanel)
-        left_layout = QVBoxLayout(left_panel)
-        
-        # Search bar
-        self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("🔍 Search 100+ constants...")
-        self.search_bar.textChanged.connect(self.filter_list)
-        
-        # Constants list
-        self.constants_list = QListWidget()
-        self.constants_list.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
-        
-        left_layout.addWidget(self.search_bar)
-        left_layout.addWidget(self.constants_list)
+# Function name: (mpmath function, accepted argument counts)
+EXPRESSION_FUNCTIONS = {
+    'sqrt': ('sqrt', (1,)), 'cbrt': ('cbrt', (1,)), 'root': ('root', (2,)),
+    'exp': ('exp', (1,)), 'log': ('log', (1, 2)), 'ln': ('ln', (1,)), 'log10': ('log10', (1,)),
+    'sin': ('sin', (1,)), 'cos': ('cos', (1,)), 'tan': ('tan', (1,)),
+    'asin': ('asin', (1,)), 'acos': ('acos', (1,)), 'atan': ('atan', (1,)), 'atan2': ('atan2', (2,)),
+    'sinh': ('sinh', (1,)), 'cosh': ('cosh', (1,)), 'tanh': ('tanh', (1,)),
+    'asinh': ('asinh', (1,)), 'acosh': ('acosh', (1,)), 'atanh': ('atanh', (1,)),
+    'gamma': ('gamma', (1,)), 'loggamma': ('loggamma', (1,)), 'factorial': ('factorial', (1,)),
+    'binomial': ('binomial', (2,)), 'beta': ('beta', (2,)), 'zeta': ('zeta', (1, 2)),
+    'polylog': ('polylog', (2,)), 'agm': ('agm', (1, 2)), 'erf': ('erf', (1,)),
+    'lambertw': ('lambertw', (1,)), 'abs': ('fabs', (1,)),
+}
 
-        # Right panel
-        right_panel = QFrame()
-        right_panel.setFrameShape(QFrame.Shape.StyledPanel)
-        right_layout = QVBoxLayout(right_panel)
+_EXPRESSION_BINOPS = {ast.Add: 'add', ast.Sub: 'sub', ast.Mult: 'mul', ast.Div: 'div', ast.Pow: 'pow'}
+_FOLD_BITS = 4096  # Largest power of a rational folded exactly; bigger ones go to mp.power
+_NUMBER_BITS = int(4000 * math.log2(10))  # Folded numbers must print; str() stops at 4300 digits
+_MAGNITUDE_BITS = int(10**12 * math.log2(10))  # nstr() slows with the exponent's own length
 
-        # Info section
-        self.info_label = QLabel("ℹ Select a constant from the list")
-        self.info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Formula display
-        self.formula_display = QTextEdit()
-        self.formula_display.setReadOnly(True)
-        
-        # Progress bar
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setTextVisible(False)
-        
-        # Value display
-        self.value_display = QTextEdit()
-        self.value_display.setReadOnly(True)
-        
-        # Control panel
-        control_layout = QHBoxLayout()
-        self.precision_input = QLineEdit("1000")
-        self.precision_input.setPlaceholderText("Precision (e.g., 100, 1K, 1M)")
-        self.copy_btn = QPushButton("📋 Copy Value")
-        self.save_btn = QPushButton("💾 Save Value")
-        
-        control_layout.addWidget(QLabel("Precision:"))
-        control_layout.addWidget(self.precision_input)
-        control_layout.addWidget(self.copy_btn)
-        control_layout.addWidget(self.save_btn)
+# Nodes are tuples: ('num', Fraction), ('name', str), ('call', str, args), ('neg', x),
+# ('add', terms), ('mul', factors), ('div', x, y), ('pow', x, y). Sums and products
+# are flattened and sorted so that equal expressions get equal keys.
 
-        right_layout.addWidget(self.info_label)
-        right_layout.addWidget(self.formula_display)
-        right_layout.addWidget(self.progress_bar)
-        right_layout.addWidget(self.value_display)
-        right_layout.addLayout(control_layout)
 
-        # Add panels to main layout
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        splitter.addWidget(left_panel)
-        splitter.addWidget(right_panel)
-        splitter.setSizes([300, 1000])
-        main_layout.addWidget(splitter)
+def _node_key(node):
+    kind = node[0]
+    if kind == 'num':
+        value = node[1]
+        return str(value) if value.denominator == 1 and value >= 0 else f"({value})"
+    if kind == 'name':
+        return node[1]
+    if kind == 'call':
+        return f"{node[1]}({', '.join(_bare(arg) for arg in node[2])})"
+    if kind == 'neg':
+        return f"-{_wrap(node[1], ('add',))}"
+    if kind == 'add':
+        text = _node_key(node[1][0])
+        for term in node[1][1:]:
+            if term[0] == 'neg':
+                text += f" - {_wrap(term[1], ('add',))}"
+            elif term[0] == 'num' and term[1] < 0:
+                text += f" - {_node_key(('num', -term[1]))}"
+            else:
+                text += f" + {_node_key(term)}"
+        return text
+    if kind == 'mul':
+        factors = node[1]
+        head = _bare(factors[0]) if factors[0][0] == 'num' else _wrap(factors[0], ('add', 'neg'))
+        return "*".join([head] + [_wrap(factor, ('add', 'neg')) for factor in factors[1:]])
+    if kind == 'div':
+        return f"{_wrap(node[1], ('add', 'neg'))}/{_wrap(node[2], ('add', 'neg', 'mul', 'div'))}"
+    return f"{_wrap(node[1], ('add', 'neg', 'mul', 'div', 'pow'))}^{_wrap(node[2], ('add', 'neg', 'mul', 'div', 'pow'))}"
 
-        # Connect signals
-        self.constants_list.itemClicked.connect(self.constant_selected)
-        self.precision_input.textChanged.connect(self.start_calculation)
-        self.copy_btn.clicked.connect(self.copy_value)
-        self.save_btn.clicked.connect(self.save_value)
 
-        self.apply_styles()
-        self.populate_list()
+def _bare(node):
+    # Numbers need no parentheses as function arguments or leading coefficients
+    return str(node[1]) if node[0] == 'num' else _node_key(node)
 
-    def apply_styles(self):
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #0d0d0d;
-                color: #00ff7f;
-            }
-            QLineEdit, QTextEdit, QListWidget {
-                background-color: #1a1a1a;
-                border: 2px solid #00ff7f;
-                border-radius: 5px;
-                padding: 10px;
-                font-size: 14px;
-            }
-            QPushButton {
-                background-color: #1a1a1a;
-                border: 2px solid #00ff7f;
-                border-radius: 5px;
-                padding: 8px;
-                min-width: 100px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #262626;
-            }
-            QProgressBar {
-                border: 2px solid #00ff7f;
-                border-radius: 5px;
-                height: 20px;
-            }
-            QProgressBar::chunk {
-                background-color: #00ff7f;
-            }
-            QSplitter::handle {
-                background-color: #00ff7f;
-                width: 2px;
-            }
-        """)
-        self.formula_display.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: #00ff7f;
-        """)
-        self.value_display.setStyleSheet("""
-            font-family: 'Consolas';
-            font-size: 14px;
-            color: #00ff7f;
-        """)
-        self.info_label.setStyleSheet("font-size: 16px;")
 
-    # ==================================================================
-    # Core Functionality
-    # ==================================================================
+def _wrap(node, loose):
+    key = _node_key(node)
+    return f"({key})" if node[0] in loose else key
 
-    def populate_list(self):
-        self.constants_list.clear()
-        for name in self.constants.keys():
-            item = QListWidgetItem(f"✦ {name}")
-            item.setData(Qt.ItemDataRole.UserRole, name)
-            self.constants_list.addItem(item)
 
-    def filter_list(self):
-        search_text = self.search_bar.text().lower()
-        for i in range(self.constants_list.count()):
-            item = self.constants_list.item(i)
-            item.setHidden(search_text not in item.text().lower())
+def _parse_expression(text):
+    if len(text) > EXPRESSION_MAX_LENGTH:
+        raise ValueError(f"Expressions are limited to {EXPRESSION_MAX_LENGTH} characters")
+    source = text.replace('^', '**')
+    try:
+        tree = ast.parse(source, mode='eval')
+        return _convert(tree.body, source)
+    except (SyntaxError, RecursionError):
+        raise ValueError(f"Invalid expression: {text}") from None
 
-    def constant_selected(self, item):
-        self.current_constant = item.data(Qt.ItemDataRole.UserRole)
-        self.update_info_display()
-        self.start_calculation()
 
-    def update_info_display(self):
-        constant_data = self.constants[self.current_constant]
-        info_text = f"""
-        <b>{self.current_constant}</b><br>
-        <i>{constant_data['reference']}</i><br>
-        Accuracy: {constant_data['accuracy']}
-        """
-        self.info_label.setText(info_text)
-        self.formula_display.setText(constant_data['formula'])
+def _convert(node, source):
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        literal = ast.get_source_segment(source, node).replace('_', '')
+        # Fraction rejects 0x10 and would expand 1e2000000 digit by digit
+        if not math.isfinite(node.value):
+            raise SyntaxError(literal)
+        try:
+            return ('num', Fraction(literal))
+        except ValueError:
+            raise SyntaxError(literal) from None
+    if isinstance(node, ast.Name):
+        if node.id not in EXPRESSION_CONSTANTS:
+            raise ValueError(f"Unknown constant '{node.id}'")
+        return ('name', node.id)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _convert(node.operand, source)
+        return _fold(('neg', operand)) if isinstance(node.op, ast.USub) else operand
+    if isinstance(node, ast.BinOp) and type(node.op) in _EXPRESSION_BINOPS:
+        left, right = _convert(node.left, source), _convert(node.right, source)
+        kind = _EXPRESSION_BINOPS[type(node.op)]
+        if kind == 'sub':
+            return _fold(('add', (left, _fold(('neg', right)))))
+        return _fold((kind, (left, right)) if kind in ('add', 'mul') else (kind, left, right))
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+        name = node.func.id
+        if name not in EXPRESSION_FUNCTIONS:
+            raise ValueError(f"Unknown function '{name}'")
+        if len(node.args) not in EXPRESSION_FUNCTIONS[name][1]:
+            raise ValueError(f"Wrong number of arguments for {name}()")
+        return ('call', name, tuple(_convert(arg, source) for arg in node.args))
+    raise ValueError(f"Unsupported syntax: {ast.get_source_segment(source, node)}")
 
-    def start_calculation(self):
-        if self.calculation_thread and self.calculation_thread.isRunning():
-            self.calculation_thread.stop()
 
-        precision = self.parse_precision(self.precision_input.text())
-        self.progress_bar.setValue(0)
-        self.value_display.setPlainText("⌛ Calculating...")
+def _fold(node):
+    # Constant folding on exact rationals, plus flattening of sums and products
+    kind = node[0]
+    if kind == 'neg':
+        inner = node[1]
+        if inner[0] == 'num':
+            return ('num', -inner[1])
+        return inner[1] if inner[0] == 'neg' else node
+    if kind in ('add', 'mul'):
+        items, number = [], Fraction(0 if kind == 'add' else 1)
+        for item in node[1]:
+            for part in (item[1] if item[0] == kind else (item,)):
+                if part[0] != 'num':
+                    items.append(part)
+                elif kind == 'add':
+                    number += part[1]
+                else:
+                    number *= part[1]
+        if kind == 'mul' and number == 0:
+            return ('num', number)
+        _check_number(number)
+        items.sort(key=_node_key)
+        # Numbers go last in sums and first in products: pi^2/6 - 1, 2*pi
+        if number != (0 if kind == 'add' else 1) or not items:
+            items.insert(len(items) if kind == 'add' else 0, ('num', number))
+        return items[0] if len(items) == 1 else (kind, tuple(items))
+    left, right = node[1], node[2]
+    if kind == 'div':
+        if right == ('num', 0):
+            raise ValueError("Division by zero")
+        if left[0] == 'num' and right[0] == 'num':
+            return ('num', _check_number(left[1] / right[1]))
+        return left if right == ('num', 1) else node
+    # kind == 'pow'
+    if right[0] == 'num' and right[1].denominator == 1:
+        exponent = right[1].numerator
+        if exponent == 1:
+            return left
+        if exponent == 0:
+            return ('num', Fraction(1))
+        if left[0] == 'num':
+            if left[1] == 0 and exponent < 0:
+                raise ValueError("Division by zero")
+            base = left[1]
+            size = max(base.numerator.bit_length(), base.denominator.bit_length())
+            if abs(exponent) * size <= _FOLD_BITS:
+                return ('num', base ** exponent)
+    return node
 
-        self.calculation_thread = CalculationThread(
-            self.constants[self.current_constant],
-            precision
-        )
-        self.calculation_thread.update_progress.connect(self.update_progress)
-        self.calculation_thread.result_ready.connect(self.show_result)
-        self.calculation_thread.start()
 
-    def update_progress(self, value, formula):
-        self.progress_bar.setValue(value)
-        self.formula_display.setText(f"{formula}\n\nProgress: {value}%")
+def _check_number(number):
+    if max(number.numerator.bit_length(), number.denominator.bit_length()) > _NUMBER_BITS:
+        raise ValueError("Numbers in an expression are limited to 4,000 digits")
+    return number
 
-    def show_result(self, result, formula):
-        self.progress_bar.setValue(100)
-        self.value_display.setPlainText(result)
-        self.formula_display.setText(formula)
-        self.value_display.moveCursor(QTextCursor.MoveOperation.Start)
 
-    def parse_precision(self, text):
-        text = text.strip().upper().replace(" ", "")
-        if not text:
-            return 100
-        multipliers = {'K': 10**3, 'M': 10**6, 'B': 10**9}
-        suffix = text[-1] if text[-1] in multipliers else ''
-        base = text[:-1] if suffix else text
-        
-        try:
-            num = float(base) * multipliers.get(suffix, 1)
-            return min(int(num), 10**6)  # Max 1 million digits
-        except:
-            return 100
+class CompiledExpression:
+    # A parsed, folded expression flattened into steps, one per distinct
+    # subexpression. Calling it evaluates at the current mpmath precision.
+    def __init__(self, root):
+        self.key = _node_key(root)
+        self.steps = []
+        slots = {}
 
-    def copy_value(self):
-        QApplication.clipboard().setText(self.value_display.toPlainText())
+        def emit(node):
+            key = _node_key(node)
+            if key not in slots:
+                kind = node[0]
+                if kind == 'call':
+                    operands = tuple(emit(arg) for arg in node[2])
+                elif kind in ('add', 'mul'):
+                    operands = tuple(emit(item) for item in node[1])
+                elif kind in ('div', 'pow'):
+                    operands = (emit(node[1]), emit(node[2]))
+                elif kind == 'neg':
+                    operands = (emit(node[1]),)
+                else:
+                    operands = ()
+                slots[key] = len(self.steps)
+                self.steps.append((key, node, operands))
+            return slots[key]
+
+        emit(root)
+
+    def __call__(self):
+        dps = mp.mp.dps
+        values = []
+        for key, node, operands in self.steps:
+            value = _cached_value(key, dps)
+            if value is None:
+                try:
+                    value = _evaluate_step(node, [values[i] for i in operands])
+                except ZeroDivisionError:
+                    raise ValueError("Division by zero") from None
+                _check_magnitude(value)
+                if node[0] != 'num':
+                    _store_value(key, dps, value)
+            values.append(value)
+        return values[-1]
+
+
+def _evaluate_step(node, args):
+    kind = node[0]
+    if kind == 'num':
+        return mp.mpf(node[1].numerator) / node[1].denominator
+    if kind == 'name':
+        return +getattr(mp, EXPRESSION_CONSTANTS[node[1]])
+    if kind == 'call':
+        return getattr(mp, EXPRESSION_FUNCTIONS[node[1]][0])(*args)
+    if kind == 'neg':
+        return -args[0]
+    if kind == 'add':
+        return mp.fsum(args)
+    if kind == 'mul':
+        return mp.fprod(args)
+    if kind == 'div':
+        return args[0] / args[1]
+    return mp.power(args[0], args[1])
+
+
+def _check_magnitude(value):
+    # 2^2^2^2^2^2 evaluates at once, but its digits could never be printed
+    if value and mp.isfinite(value) and abs(mp.mag(value)) > _MAGNITUDE_BITS:
+        raise ValueError("Expression values are limited to magnitudes of 10^±10^12")
+
+
+_expression_values = {}  # key -> (dps, value), kept at the highest precision computed
+_expression_compiled = {}  # source text and normalized form -> CompiledExpression
+_expression_lock = threading.Lock()
+
+
+def _cached_value(key, dps):
+    with _expression_lock:
+        entry = _expression_values.get(key)
+    if entry is None or entry[0] < dps:
+        return None
+    return +entry[1]  # Round to the current precision
+
+
+def _store_value(key, dps, value):
+    with _expression_lock:
+        if key in _expression_values and _expression_values[key][0] >= dps:
+            return
+        _expression_values.pop(key, None)
+        if len(_expression_values) >= EXPRESSION_CACHE_SIZE:
+            del _expression_values[next(iter(_expression_values))]
+        _expression_values[key] = (dps, value)
+
+
+def compile_expression(text):
+    text = " ".join(text.split())
+    with _expression_lock:
+        compiled = _expression_compiled.get(text)
+    if compiled is None:
+        compiled = CompiledExpression(_parse_expression(text))
+        with _expression_lock:
+            compiled = _expression_compiled.setdefault(compiled.key, compiled)
+            _expression_compiled[text] = compiled
+    return compiled
+
+
+def expression_constant(text):
+    # Registry entry for a user expression, so it runs like any catalog constant
+    compiled = compile_expression(text)
+    return EXPRESSION_PREFIX + compiled.key, {
+        'func': compiled,
+        'formula': compiled.key,
+        'accuracy': "User-defined expression",
+        'reference': f"{len(compiled.steps)} distinct subexpressions",
+    }
 
-    def save_value(self):
-        options = QFileDialog.Option.ReadOnly
-        filename, _ = QFileDialog.getSaveFileName(
-            self, "Save Constant Value", "", 
-            "Text Files (*.txt);;All Files (*)", options=options)
-        if filename:
-            with open(filename, 'w') as f:
-                f.write(f"=== {self.current_constant} ===\n")
-                f.write(f"Formula: {self.constants[self.current_constant]['formula']}\n")
-                f.write(f"Precision: {self.precision_input.text()}\n\n")
-                f.write(self.value_display.toPlainText())
 
 # ======================================================================
-# Application Entry Point
+# Checkpointed Engines
 # ======================================================================
 
+CHECKPOINT_DIR = os.path.join(os.path.expanduser("~"), ".constant_z", "checkpoints")
+CHECKPOINT_INTERVAL = 30  # Seconds between checkpoint writes
+CHECKPOINT_MIN_DIGITS = 10**5  # Below this, engines are not worth resuming
+
+
+class CalculationCancelled(Exception):
+    pass
+
+
+class CheckpointStore:
+    def __init__(self, directory=CHECKPOINT_DIR):
+        self.directory = directory
+
+    def path(self, name, precision):
+        key = hashlib.sha1(f"{name}|{precision}".encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.directory, f"{key}.ckpt")
+
+    def exists(self, name, precision):
+        return os.path.exists(self.path(name, precision))
+
+    def load(self, name, precision, engine):
+        try:
+            with open(self.path(name, precision), 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if (data.get('name'), data.get('precision'), data.get('engine')) != (name, precision, engine):
+            return None
+        return data['state']
+
+    def save(self, name, precision, engine, state):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(name, precision)
+        data = {'name': name, 'precision': precision, 'engine': engine, 'state': state}
+        # Write-then-rename so a crash mid-write never clobbers the previous checkpoint
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def discard(self, name, precision):
+        try:
+            os.remove(self.path(name, precision))
+        except FileNotFoundError:
+            pass
+
+
+class _Checkpointer:
+    def __init__(self, store, name, precision, engine, should_stop):
+        self.store = store
+        self.name = name
+        self.precision = precision
+        self.engine = engine
+        self.should_stop = should_stop
+        self.last = time.monotonic()
+
+    def resume(self):
+        return self.store.load(self.name, self.precision, self.engine) if self.store else None
+
+    def step(self, state):
+        cancelled = self.should_stop is not None and self.should_stop()
+        if self.store and (cancelled or time.monotonic() - self.last >= CHECKPOINT_INTERVAL):
+            self.store.save(self.name, self.precision, self.engine,
+                            state() if callable(state) else state)
+            self.last = time.monotonic()
+        if cancelled:
+            raise CalculationCancelled()
+
+    def done(self):
+        if self.store:
+            self.store.discard(self.name, self.precision)
+
+
+class _Products:
+    # Running P/Q/T of a series engine, either in memory or parked in scratch files
+    def __init__(self, state, scratch=None):
+        self.scratch = scratch
+        self.values = {key: state[key] for key in 'PQT'}
+        if scratch:
+            for key, value in self.values.items():
+                scratch.store(key, value)
+            self.values = {}
+
+    def get(self, key):
+        return self.scratch.load(key) if self.scratch else self.values[key]
+
+    def set(self, key, value):
+        if self.scratch:
+            self.scratch.store(key, value)
+        else:
+            self.values[key] = value
+
+    def snapshot(self, n):
+        return {'n': n, **{key: self.get(key) for key in 'PQT'}}
+
+
+class SeriesEngine:
+    # Sum of a(k) * p(0)...p(k) / (q(0)...q(k)) by chunked binary splitting;
+    # the running P/Q/T products are the resumable state.
+    kind = 'series'
+
+    def __init__(self, p, q, a, terms, finish):
+        self.p = p
+        self.q = q
+        self.a = a
+        self.terms = terms
+        self.finish = finish
+
+    def _bsplit(self, lo, hi):
+        if hi - lo == 1:
+            p = self.p(lo)
+            return p, self.q(lo), self.a(lo) * p
+        mid = (lo + hi) // 2
+        P1, Q1, T1 = self._bsplit(lo, mid)
+        P2, Q2, T2 = self._bsplit(mid, hi)
+        return P1 * P2, Q1 * Q2, T1 * Q2 + P1 * T2
+
+    def run(self, dps, checkpointer, progress=None, scratch=None):
+        total = self.terms(dps)
+        state = checkpointer.resume() or {'n': 0, 'P': 1, 'Q': 1, 'T': 0}
+        n = state['n']
+        products = _Products(state, scratch)
+        del state
+        chunk = max(1, total // 100)
+        while n < total:
+            hi = min(n + chunk, total)
+            P2, Q2, T2 = self._bsplit(n, hi)
+            # Only one full-size product is loaded at a time when spilling to scratch
+            T = products.get('T') * Q2
+            T += products.get('P') * T2
+            products.set('T', T)
+            del T
+            products.set('P', products.get('P') * P2)
+            products.set('Q', products.get('Q') * Q2)
+            n = hi
+            if progress:
+                progress(100 * n // total)
+            checkpointer.step(lambda: products.snapshot(n))
+        with mp.workdps(dps):
+            return self.finish(mp.mpf(products.get('T')), mp.mpf(products.get('Q')))
+
+
+class AGMEngine:
+    # Arithmetic-geometric mean iteration; each step's mpf values are the state.
+    kind = 'agm'
+
+    def __init__(self, init, step, finish):
+        self.init = init
+        self.step = step
+        self.finish = finish
+
+    def run(self, dps, checkpointer, progress=None, scratch=None):
+        with mp.workdps(dps):
+            saved = checkpointer.resume()
+            if saved:
+                iteration = saved['iteration']
+                values = {k: mp.make_mpf(v) for k, v in saved['values'].items()}
+            else:
+                iteration, values = 0, self.init()
+            eps = mp.mpf(10) ** (5 - dps)
+            expected = max(1, int(math.log2(max(dps, 2))) + 1)  # AGM converges quadratically
+            while abs(values['a'] - values['b']) > eps:
+                values = self.step(values)
+                iteration += 1
+                if progress:
+                    progress(min(99, 100 * iteration // expected))
+                checkpointer.step({'iteration': iteration,
+                                   'values': {k: v._mpf_ for k, v in values.items()}})
+            return self.finish(values)
+
+
+class NewtonSqrtEngine:
+    # Integer Newton iteration for sqrt(n), doubling the bit precision per step.
+    kind = 'newton'
+
+    def __init__(self, n, finish=lambda root: root):
+        self.n = n
+        self.finish = finish
+
+    def run(self, dps, checkpointer, progress=None, scratch=None):
+        target = int(dps * 3.33) + 16
+        state = checkpointer.resume() or {'bits': 32, 'x': math.isqrt(self.n << 64)}
+        steps = max(1, int(math.log2(target / 32)) + 1)
+        while state['bits'] < target:
+            bits = min(2 * state['bits'], target)
+            x = state['x'] << (bits - state['bits'])
+            x = (x + (self.n << (2 * bits)) // x) >> 1
+            state = {'bits': bits, 'x': x}
+            if progress:
+                progress(min(99, 100 * int(math.log2(bits / 32)) // steps))
+            checkpointer.step(state)
+        with mp.workdps(dps):
+            return self.finish(mp.mpf((state['x'], -state['bits'])))
+
+
+def _factorial_terms(dps):
+    # Smallest n with log10(n!) > dps, so the tail of sum 1/k! is below 10^-dps
+    lo, hi = 1, 2
+    while math.lgamma(hi + 1) / math.log(10) <= dps:
+        lo, hi = hi, 2 * hi
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if math.lgamma(mid + 1) / math.log(10) <= dps:
+            lo = mid + 1
+        else:
+            hi = mid
+    return hi + 2
+
+
+def _gauss_legendre_step(v):
+    a = (v['a'] + v['b']) / 2
+    return {'a': a, 'b': mp.sqrt(v['a'] * v['b']),
+            't': v['t'] - v['p'] * (v['a'] - a)**2, 'p': 2 * v['p']}
+
+
+ENGINES = {
+    "Pi": SeriesEngine(
+        p=lambda k: 1 if k == 0 else -(6*k - 5) * (2*k - 1) * (6*k - 1),
+        q=lambda k: 1 if k == 0 else k**3 * 10939058860032000,  # 640320³/24
+        a=lambda k: 13591409 + 545140134*k,
+        terms=lambda dps: int(dps / 14.18) + 2,
+        finish=lambda T, Q: 426880 * mp.sqrt(10005) * Q / T),
+    "Euler’s Number": SeriesEngine(
+        p=lambda k: 1,
+        q=lambda k: max(k, 1),
+        a=lambda k: 1,
+        terms=_factorial_terms,
+        finish=lambda T, Q: T / Q),
+    "Apéry’s Constant": SeriesEngine(
+        p=lambda k: 1 if k == 0 else -k**5,
+        q=lambda k: 1 if k == 0 else 32 * (2*k + 1)**5,
+        a=lambda k: 205*k*k + 250*k + 77,
+        terms=lambda dps: int(dps / 3.01) + 2,
+        finish=lambda T, Q: T / (64 * Q)),
+    "Gauss’s Constant": AGMEngine(
+        init=lambda: {'a': mp.mpf(1), 'b': mp.sqrt(2)},
+        step=lambda v: {'a': (v['a'] + v['b']) / 2, 'b': mp.sqrt(v['a'] * v['b'])},
+        finish=lambda v: 1 / v['a']),
+    "Bailey–Borwein–Plouffe Constant": AGMEngine(
+        init=lambda: {'a': mp.mpf(1), 'b': 1 / mp.sqrt(2), 't': mp.mpf(0.25), 'p': mp.mpf(1)},
+        step=_gauss_legendre_step,
+        finish=lambda v: (v['a'] + v['b'])**2 / (4 * v['t'])),
+    "Square Root of 2": NewtonSqrtEngine(2),
+    "Square Root of 3": NewtonSqrtEngine(3),
+    "Golden Ratio": NewtonSqrtEngine(5, finish=lambda root: (1 + root) / 2),
+}
+
+
+def run_engine(name, precision, dps, store=None, progress=None, should_stop=None, scratch=None):
+    engine = ENGINES[name]
+    checkpointer = _Checkpointer(store, name, precision, engine.kind, should_stop)
+    value = engine.run(dps, checkpointer, progress, scratch)
+    checkpointer.done()
+    return value
+
+
+# ======================================================================
+# Large-Precision Mode
+# ======================================================================
+
+SCRATCH_DIR = os.path.join(os.path.expanduser("~"), ".constant_z", "scratch")
+RESULTS_DIR = os.path.join(os.path.expanduser("~"), ".constant_z", "results")
+BYTES_PER_DIGIT = math.log2(10) / 8
+WORKING_OPERANDS = 8  # Full-size big integers alive at the peak of an in-memory run
+SPILLED_OPERANDS = 3  # ... and when the running products live in scratch files
+MEMORY_HEADROOM = 0.8  # Fraction of available RAM a single job may plan for
+PREVIEW_DIGITS = 10000
+DIGIT_LEAF = 2000  # Digits converted with str() at the bottom of the radix split
+
+
+def available_memory():
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def estimate_memory(precision, out_of_core=False):
+    if out_of_core:
+        return int(precision * BYTES_PER_DIGIT * SPILLED_OPERANDS)
+    # Big-integer operands plus the result string and its display copy
+    return int(precision * BYTES_PER_DIGIT * WORKING_OPERANDS) + 2 * precision
+
+
+def spills_to_disk(name, backend=None):
+    # Only the series engines keep their running products in scratch files;
+    # the AGM and Newton engines, flint and mpmath always run in memory
+    engine = ENGINES.get(name)
+    return backend in (None, 'engine') and getattr(engine, 'kind', None) == 'series'
+
+
+def plan_precision(precision, limit=None, spills=False):
+    available = available_memory()
+    if limit is None and available is not None:
+        limit = available * MEMORY_HEADROOM
+    plan = {'precision': precision, 'out_of_core': False,
+            'memory': estimate_memory(precision), 'disk': 0, 'available': available}
+    if limit is None or plan['memory'] <= limit:
+        return plan
+    if not spills:
+        raise ValueError(
+            f"{precision:,} digits needs ~{format_bytes(plan['memory'])} RAM and this "
+            f"backend cannot spill to disk; {format_bytes(limit)} RAM available")
+
+    memory = estimate_memory(precision, out_of_core=True)
+    disk = int(precision * (1 + 3 * BYTES_PER_DIGIT))  # Digit file plus spilled P/Q/T
+    free = shutil.disk_usage(os.path.expanduser("~")).free
+    if memory > limit or disk > free:
+        raise ValueError(
+            f"{precision:,} digits needs ~{format_bytes(memory)} RAM and "
+            f"{format_bytes(disk)} scratch disk; {format_bytes(limit)} RAM and "
+            f"{format_bytes(free)} disk available")
+    plan.update(out_of_core=True, memory=memory, disk=disk)
+    return plan
+
+
+def describe_plan(plan):
+    mode = "out-of-core" if plan['out_of_core'] else "in memory"
+    text = f"{plan['precision']:,} digits · {mode} · ~{format_bytes(plan['memory'])} RAM"
+    if plan['disk']:
+        text += f" + {format_bytes(plan['disk'])} scratch"
+    return text
+
+
+class ScratchSpace:
+    # Big integers parked in memory-mapped files between uses
+    def __init__(self, directory=SCRATCH_DIR):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = tempfile.mkdtemp(dir=directory)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def store(self, key, value):
+        size = value.bit_length() // 8 + 1
+        with open(self._path(key), 'w+b') as f:
+            f.truncate(size)
+            with mmap.mmap(f.fileno(), size) as mm:
+                mm[:] = value.to_bytes(size, 'little', signed=True)
+
+    def load(self, key):
+        with open(self._path(key), 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return int.from_bytes(mm, 'little', signed=True)
+
+    def close(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _emit_digits(mm, offset, n, width, powers):
+    # Divide-and-conquer radix conversion straight into the mapped file
+    if width <= DIGIT_LEAF:
+        mm[offset:offset + width] = str(n).zfill(width).encode('ascii')
+        return
+    low = width // 2
+    if low not in powers:
+        powers[low] = 10**low
+    high, n = divmod(n, powers[low])
+    _emit_digits(mm, offset, high, width - low, powers)
+    _emit_digits(mm, offset + width - low, n, low, powers)
+
+
+def write_digits(value, precision, path):
+    if not isinstance(value, (mp.mpf, mp.iv.mpf)) or not value:
+        with open(path, 'w') as f:
+            f.write(format_value(value, precision))
+        return
+    with mp.workdps(working_dps(precision)):
+        sign = '-' if value < 0 else ''
+        value = abs(value)
+        with mp.workdps(30):  # A full-precision log would cost more than the digits
+            mag = int(mp.floor(mp.log10(+value)))
+        if value < mp.mpf(10)**mag:
+            mag -= 1
+        elif value >= mp.mpf(10)**(mag + 1):
+            mag += 1
+        if value * mp.mpf(10)**(precision - 1 - mag) >= mp.mpf(10)**precision - 0.5:
+            mag += 1  # Rounding carries into a new leading digit
+        scaled = int(mp.nint(value * mp.mpf(10)**(precision - 1 - mag)))
+    if mag >= 0:
+        whole, scaled = divmod(scaled, 10**(precision - 1 - mag))
+        prefix = f"{sign}{whole}."
+        width = precision - 1 - mag
+    else:
+        prefix = f"{sign}0.{'0' * (-mag - 1)}"
+        width = precision
+    size = len(prefix) + width
+    with open(path, 'w+b') as f:
+        f.truncate(size)
+        with mmap.mmap(f.fileno(), size) as mm:
+            mm[:len(prefix)] = prefix.encode('ascii')
+            _emit_digits(mm, len(prefix), scaled, width, {})
+
+
+def result_path(name, precision):
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    slug = ''.join(c if c.isalnum() else '_' for c in name).strip('_')
+    return os.path.join(RESULTS_DIR, f"{slug}_{precision}.txt")
+
+
+def read_preview(path, digits=PREVIEW_DIGITS):
+    with open(path) as f:
+        head = f.read(digits)
+    return f"{head}…\n\n[{os.path.getsize(path):,} characters written to {path}]"
+
+
+def text_preview(text, digits=PREVIEW_DIGITS):
+    if len(text) <= digits:
+        return text
+    return f"{text[:digits]}…\n\n[{len(text):,} characters; copy or save for the full value]"
+
+
+# ======================================================================
+# Big-Number Backends
+# ======================================================================
+
+flint = _LazyModule('flint', optional=True)
+
+APP_DIR = os.path.join(os.path.expanduser("~"), ".constant_z")
+BENCHMARK_FILE = os.path.join(APP_DIR, "backend_benchmark.json")
+BENCHMARK_BANDS = (10**3, 10**4, 10**5)  # Upper digit bound of each precision band
+BENCHMARK_TRIAL_CAP = 30.0  # Seconds before a single trial is abandoned
+BENCHMARK_BEATEN = 5  # A backend this many times slower than the best is not timed further
+BENCHMARK_REPEATS = 3  # Runs per trial; the fastest one counts
+
+# Constants python-flint (arb) can evaluate natively; everything else stays on mpmath
+FLINT_CONSTANTS = {
+    "Pi": lambda: flint.arb.pi(),
+    "Bailey–Borwein–Plouffe Constant": lambda: flint.arb.pi(),
+    "Euler’s Number": lambda: flint.arb.const_e(),
+    "Golden Ratio": lambda: (1 + flint.arb(5).sqrt()) / 2,
+    "Square Root of 2": lambda: flint.arb(2).sqrt(),
+    "Square Root of 3": lambda: flint.arb(3).sqrt(),
+    "Apéry’s Constant": lambda: flint.arb(3).zeta(),
+    "Catalan’s Constant": lambda: flint.arb.const_catalan(),
+    "Khinchin’s Constant": lambda: flint.arb.const_khinchin(),
+    "Glaisher–Kinkelin Constant": lambda: flint.arb.const_glaisher(),
+    "Euler–Mascheroni Constant": lambda: flint.arb.const_euler(),
+    "Lévy’s Constant": lambda: flint.arb.pi()**2 / (12 * flint.arb.const_log2()),
+    "Gelfond’s Constant": lambda: flint.arb.pi().exp(),
+}
+
+
+def working_dps(precision):
+    return int(precision * 1.1) + 10
+
+
+def backend_label(backend):
+    if backend == 'flint':
+        return "python-flint (arb)"
+    if backend == 'engine':
+        return "checkpointed engine"
+    # mpmath picks gmpy2 integers on import when available
+    return "mpmath (gmpy2)" if mp.libmp.BACKEND == 'gmpy' else "mpmath (pure Python)"
+
+
+def precision_band(precision):
+    for bound in BENCHMARK_BANDS:
+        if precision <= bound:
+            return bound
+    return BENCHMARK_BANDS[-1]
+
+
+def _arb_to_mpf(value):
+    man, exp = value.mid().man_exp()
+    return mp.mpf((int(man), int(exp)))
+
+
+class BackendSelector:
+    def __init__(self, path=BENCHMARK_FILE, checkpoints=None):
+        self.path = path
+        self.choices = self._load()
+        self.checkpoints = checkpoints or CheckpointStore()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.choices, f, indent=2, ensure_ascii=False)
+
+    def available(self, name):
+        backends = ['mpmath']
+        if flint and name in FLINT_CONSTANTS:
+            backends.append('flint')
+        if name in ENGINES:
+            backends.append('engine')
+        return backends
+
+    def choose(self, name, precision, preferred=None):
+        backends = self.available(name)
+        if preferred in backends:
+            return preferred
+        # An interrupted run always picks up where it stopped
+        if 'engine' in backends and self.checkpoints.exists(name, precision):
+            return 'engine'
+        choice = self.choices.get(f"{name}|{precision_band(precision)}")
+        if choice in backends:
+            return choice
+        # Without benchmark data arb is the safer bet at high precision
+        if 'flint' in backends:
+            return 'flint'
+        if 'engine' in backends and precision >= CHECKPOINT_MIN_DIGITS:
+            return 'engine'
+        return 'mpmath'
+
+    def evaluate(self, name, constant_data, precision, backend=None,
+                 progress=None, should_stop=None, scratch=None):
+        if scratch is not None and backend is None and name in ENGINES:
+            backend = 'engine'  # Only the engines can spill their operands
+        backend = self.choose(name, precision, backend)
+        dps = working_dps(precision)
+        if backend == 'engine':
+            store = self.checkpoints if precision >= CHECKPOINT_MIN_DIGITS else None
+            value = run_engine(name, precision, dps, store, progress, should_stop, scratch)
+            return value, backend
+        if backend == 'flint':
+            saved = flint.ctx.dps
+            flint.ctx.dps = dps
+            try:
+                value = FLINT_CONSTANTS[name]()
+            finally:
+                flint.ctx.dps = saved
+            with mp.workdps(dps):
+                return _arb_to_mpf(value), backend
+        with mp.workdps(dps):
+            value = constant_data['func']()
+            # Lazy mpmath constants (mp.pi, mp.catalan, ...) must be fixed at this precision
+            return (+value if isinstance(value, type(mp.pi)) else value), backend
+
+    def _time_trial(self, name, constant_data, precision, backend, cap):
+        # Each run is a separate child, so a slow one can be stopped at the cap and
+        # no run benefits from constants cached by an earlier one. The best of a few
+        # runs is kept: a single sub-millisecond run is mostly noise.
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        else:
+            context = multiprocessing.get_context('spawn')
+            constant_data = None  # Rebuilt by the child; catalog functions do not pickle
+        best = None
+        for _ in range(BENCHMARK_REPEATS):
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(target=_benchmark_trial,
+                                      args=(sender, name, constant_data, precision, backend))
+            process.start()
+            sender.close()
+            try:
+                elapsed = receiver.recv() if receiver.poll(cap) else None
+            except EOFError:
+                elapsed = None  # The trial failed
+            finally:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+                receiver.close()
+            if elapsed is None:
+                return best
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    def benchmark(self, constants, report=None):
+        mp.mpf(0), bool(flint)  # Import once here, so forked trials do not time the imports
+        for name, constant_data in constants.items():
+            backends = self.available(name)
+            if len(backends) < 2:
+                continue
+            for bound in BENCHMARK_BANDS:
+                timings = {}
+                for backend in backends:
+                    best = min((t for t in timings.values() if t is not None), default=None)
+                    cap = BENCHMARK_TRIAL_CAP if best is None else min(
+                        BENCHMARK_TRIAL_CAP, BENCHMARK_BEATEN * best)
+                    timings[backend] = self._time_trial(name, constant_data, bound, backend, cap)
+                finished = {b: t for b, t in timings.items() if t is not None}
+                if not finished:
+                    break
+                choice = min(finished, key=finished.get)
+                self.choices[f"{name}|{bound}"] = choice
+                self._save()
+                if report:
+                    report(name, bound, timings, choice)
+                # Time grows with precision: a beaten backend stays beaten in higher bands,
+                # and the winner is timed first so the others get a tight cap
+                backends = [choice] + [b for b, t in finished.items()
+                                       if b != choice and t < BENCHMARK_BEATEN * finished[choice]]
+                if len(backends) < 2:
+                    for higher in BENCHMARK_BANDS[BENCHMARK_BANDS.index(bound) + 1:]:
+                        self.choices[f"{name}|{higher}"] = choice
+                    self._save()
+                    break
+
+
+def _benchmark_trial(conn, name, constant_data, precision, backend):
+    # Module level, so spawned children can import it
+    if constant_data is None:
+        constant_data = load_constants()[name]
+        mp.mpf(0), bool(flint)  # A spawned child imports afresh; keep that out of the timing
+    selector = BackendSelector()
+    selector.checkpoints = None  # A stopped trial must not leave a checkpoint behind
+    start = time.perf_counter()
+    selector.evaluate(name, constant_data, precision, backend)
+    conn.send(time.perf_counter() - start)
+
+
+def parse_precision(text):
+    text = text.strip().upper().replace(" ", "")
+    if not text:
+        return 100
+    multipliers = {'K': 10**3, 'M': 10**6, 'B': 10**9}
+    suffix = text[-1] if text[-1] in multipliers else ''
+    base = text[:-1] if suffix else text
+
+    try:
+        num = float(base) * multipliers.get(suffix, 1)
+        return max(int(num), 1)  # Upper bound comes from plan_precision()
+    except:
+        return 100
+
+
+def format_value(value, precision):
+    return mp.nstr(value, precision) if isinstance(value, (mp.mpf, mp.iv.mpf)) else str(value)
+
+
+# ======================================================================
+# Derived Physical Constants
+# ======================================================================
+
+CODATA_FILE = os.path.join(APP_DIR, "codata.json")  # Optional input overrides for a newer release
+CODATA_RELEASE = "CODATA 2018"
+
+# Defining and measured inputs: symbol -> (catalog name, value, standard uncertainty).
+# The five SI defining constants are exact.
+CODATA_INPUTS = {
+    'c': (None, '299792458', '0'),
+    'h': (None, '6.62607015e-34', '0'),
+    'e': ("Elementary Charge", '1.602176634e-19', '0'),
+    'k_B': ("Boltzmann’s Constant", '1.380649e-23', '0'),
+    'N_A': ("Avogadro’s Number", '6.02214076e23', '0'),
+    'G': ("Gravitational Constant", '6.67430e-11', '0.00015e-11'),
+    'alpha': ("Fine‑Structure Constant", '7.2973525693e-3', '0.0000000011e-3'),
+    'R_inf': ("Rydberg Constant", '10973731.568160', '0.000021'),
+    'mp_me': (None, '1836.15267343', '0.00000011'),  # Proton-electron mass ratio
+}
+
+# Derived entries in evaluation order: (symbol, catalog name, numeric factor, powers).
+# Every entry is factor · Π symbolᵖ over inputs and earlier entries.
+CODATA_DERIVED = [
+    ('hbar', "Reduced Planck Constant", lambda: 1 / (2 * mp.pi), {'h': 1}),
+    ('mu0', "Permeability of Free Space", lambda: 2, {'alpha': 1, 'h': 1, 'e': -2, 'c': -1}),
+    ('eps0', "Permittivity of Free Space", None, {'mu0': -1, 'c': -2}),
+    ('k_e', "Coulomb’s Constant", lambda: 1 / (4 * mp.pi), {'eps0': -1}),
+    ('Z0', "Characteristic Impedance of Free Space", None, {'mu0': 1, 'c': 1}),
+    ('R', "Gas Constant", None, {'N_A': 1, 'k_B': 1}),
+    ('F', "Faraday Constant", None, {'N_A': 1, 'e': 1}),
+    ('N_A_h', "Molar Planck Constant", None, {'N_A': 1, 'h': 1}),
+    ('Phi0', "Magnetic Flux Quantum", lambda: mp.mpf(0.5), {'h': 1, 'e': -1}),
+    ('R_K', "von Klitzing Constant", None, {'h': 1, 'e': -2}),
+    ('K_J', "Josephson Constant", lambda: 2, {'e': 1, 'h': -1}),
+    ('sigma', "Stefan–Boltzmann Constant", lambda: 2 * mp.pi**5 / 15, {'k_B': 4, 'h': -3, 'c': -2}),
+    # x = 5(1 − e⁻ˣ) locates the peak of Planck's law in wavelength
+    ('b', "Wien’s Displacement Constant", lambda: 1 / (5 + mp.lambertw(-5 * mp.exp(-5)).real),
+     {'h': 1, 'c': 1, 'k_B': -1}),
+    ('m_e', None, lambda: 2, {'h': 1, 'R_inf': 1, 'c': -1, 'alpha': -2}),
+    ('m_p', None, None, {'m_e': 1, 'mp_me': 1}),
+    ('a0', "Bohr Radius", lambda: 1 / (4 * mp.pi), {'alpha': 1, 'R_inf': -1}),
+    ('lambda_C', "Electron Compton Wavelength", lambda: mp.mpf(0.5), {'alpha': 2, 'R_inf': -1}),
+    ('r_e', "Classical Electron Radius", None, {'alpha': 2, 'a0': 1}),
+    ('sigma_e', "Thomson Cross Section", lambda: 8 * mp.pi / 3, {'r_e': 2}),
+    ('E_h', "Hartree Energy", lambda: 2, {'R_inf': 1, 'h': 1, 'c': 1}),
+    ('Ry', "Rydberg Unit of Energy", None, {'R_inf': 1, 'h': 1, 'c': 1, 'e': -1}),  # In eV
+    ('mu_B', "Bohr Magneton", lambda: mp.mpf(0.5), {'e': 1, 'hbar': 1, 'm_e': -1}),
+    ('mu_N', "Nuclear Magneton", lambda: mp.mpf(0.5), {'e': 1, 'hbar': 1, 'm_p': -1}),
+    ('lambda_p', "Proton Compton Wavelength", None, {'h': 1, 'm_p': -1, 'c': -1}),
+    ('kappa', "Quantum of Circulation", lambda: mp.mpf(0.5), {'h': 1, 'm_e': -1}),
+    ('t_au', "Atomic Unit of Time", None, {'hbar': 1, 'E_h': -1}),
+    ('v_au', "Atomic Unit of Velocity", None, {'alpha': 1, 'c': 1}),
+    ('l_P', "Planck Length", None, {'hbar': 0.5, 'G': 0.5, 'c': -1.5}),
+    ('t_P', "Planck Time", None, {'l_P': 1, 'c': -1}),
+    ('m_P', "Planck Mass", None, {'hbar': 0.5, 'c': 0.5, 'G': -0.5}),
+    ('T_P', "Planck Temperature", None, {'m_P': 1, 'c': 2, 'k_B': -1}),
+    ('q_P', "Planck Charge", None, {'e': 1, 'alpha': -0.5}),
+    ('E_P', "Planck Energy", None, {'m_P': 1, 'c': 2}),
+    ('F_P', "Planck Force", None, {'c': 4, 'G': -1}),
+    ('p_P', "Planck Momentum", None, {'m_P': 1, 'c': 1}),
+    ('A_P', "Planck Area", None, {'l_P': 2}),
+    ('V_P', "Planck Volume", None, {'l_P': 3}),
+    ('P_P', "Planck Power", None, {'E_P': 1, 't_P': -1}),
+    ('rho_P', "Planck Density", None, {'m_P': 1, 'l_P': -3}),
+    ('I_P', "Planck Current", None, {'q_P': 1, 't_P': -1}),
+    ('omega_P', "Planck Angular Frequency", None, {'t_P': -1}),
+    ('nu_P', "Planck Frequency", None, {'t_P': -1}),
+    ('a_P', "Planck Acceleration", None, {'c': 1, 't_P': -1}),
+]
+
+
+def load_codata_inputs(path=CODATA_FILE):
+    # {"release": "...", "inputs": {"G": ["6.67430e-11", "0.00015e-11"], ...}} overrides the
+    # built-in values; everything derived follows on the next evaluation
+    inputs, release = dict(CODATA_INPUTS), CODATA_RELEASE
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except OSError:
+        return release, inputs
+    except ValueError as e:
+        raise ValueError(f"Invalid CODATA file {path}: {e}") from None
+    if not isinstance(data, dict) or not isinstance(data.get('inputs', {}), dict):
+        raise ValueError(f"Invalid CODATA file {path}: expected an object with \"inputs\"")
+    for symbol, pair in data.get('inputs', {}).items():
+        if symbol not in inputs:
+            raise ValueError(f"Unknown CODATA input '{symbol}' in {path}")
+        value, uncertainty = map(str, pair) if isinstance(pair, list) and len(pair) == 2 else ('', '')
+        try:
+            valid = float(value) != 0 and float(uncertainty) >= 0
+        except ValueError:
+            valid = False
+        if not valid:
+            raise ValueError(f"Invalid CODATA input '{symbol}' in {path}: "
+                             f"expected [value, uncertainty]")
+        inputs[symbol] = (inputs[symbol][0], value, uncertainty)
+    return str(data.get('release', release)), inputs
+
+
+_codata_warned = set()
+
+
+def catalog_codata_inputs():
+    # The catalog and calculations fall back to the built-in inputs when the
+    # override file is broken; only `codata --inputs` reports it as an error
+    try:
+        return load_codata_inputs()
+    except ValueError as e:
+        if str(e) not in _codata_warned:
+            _codata_warned.add(str(e))
+            print(f"⚠ {e}; using the built-in {CODATA_RELEASE} inputs", file=sys.stderr)
+        return CODATA_RELEASE, dict(CODATA_INPUTS)
+
+
+def _codata_exponents(inputs):
+    # Each entry as a power vector over the inputs, composed through earlier entries
+    symbols = list(inputs)
+    vectors = {s: [1 if s == t else 0 for t in symbols] for s in symbols}
+    for symbol, _, _, powers in CODATA_DERIVED:
+        vectors[symbol] = [sum(p * vectors[s][i] for s, p in powers.items())
+                           for i in range(len(symbols))]
+    return vectors
+
+
+def _propagate(exponents, relative):
+    # Uncorrelated inputs: u_r(y)² = Σ (pᵢ·u_r(xᵢ))² for y = k·Π xᵢ^pᵢ, all rows at once
+    if np:
+        return np.sqrt(((np.array(exponents, dtype=float) * np.array(relative))**2).sum(axis=1))
+    return [math.sqrt(sum((p * r)**2 for p, r in zip(row, relative))) for row in exponents]
+
+
+def codata_uncertainties(inputs=None):
+    # Relative standard uncertainty of every entry
+    if inputs is None:
+        inputs = catalog_codata_inputs()[1]
+    key = tuple(inputs.values())
+    with _codata_lock:
+        if key in _codata_relative:
+            return _codata_relative[key]
+    relative = [float(u) / float(v) for _, v, u in inputs.values()]
+    vectors = _codata_exponents(inputs)
+    symbols = list(vectors)
+    result = dict(zip(symbols, map(float, _propagate([vectors[s] for s in symbols], relative))))
+    with _codata_lock:
+        _codata_relative[key] = result
+    return result
+
+
+_codata_tables = {}  # (dps, inputs) -> {symbol: value}
+_codata_relative = {}  # inputs -> {symbol: relative uncertainty}
+_codata_lock = threading.Lock()
+
+
+def codata_table(dps, inputs=None):
+    # Evaluates every entry in one pass at dps, reusing earlier entries
+    if inputs is None:
+        inputs = catalog_codata_inputs()[1]
+    key = (dps, tuple(inputs.values()))
+    with _codata_lock:
+        if key in _codata_tables:
+            return _codata_tables[key]
+    values = {}
+    with mp.workdps(dps + 10):
+        for symbol, (_, value, _) in inputs.items():
+            values[symbol] = mp.mpf(value)
+        for symbol, _, factor, powers in CODATA_DERIVED:
+            value = mp.mpf(factor()) if factor else mp.mpf(1)
+            for s, p in powers.items():
+                value *= values[s] ** (int(p) if p == int(p) else mp.mpf(p))
+            values[symbol] = value
+    with _codata_lock:
+        _codata_tables[key] = values
+    return values
+
+
+# Catalog name -> symbol for every entry the table computes
+CODATA_SYMBOLS = {name: symbol for symbol, (name, _, _) in CODATA_INPUTS.items() if name}
+CODATA_SYMBOLS.update((name, symbol) for symbol, name, _, _ in CODATA_DERIVED if name)
+
+
+def codata_value(name):
+    return +codata_table(mp.mp.dps)[CODATA_SYMBOLS[name]]
+
+
+def codata_accuracy(name):
+    relative = codata_uncertainties()[CODATA_SYMBOLS[name]]
+    if not relative:
+        return "Exact (SI)"
+    if relative < 1e-6:
+        return f"{relative * 1e9:.2g} ppb"
+    return f"{relative * 1e6:.2g} ppm"
+
+
+# ======================================================================
+# Cross-Algorithm Verification
+# ======================================================================
+
+def _arccot_series(x):
+    # arctan(1/x) = ∑ (-1)ᵏ/((2k+1)x^(2k+1))
+    return SeriesEngine(
+        p=lambda k: 1 if k == 0 else -(2*k - 1),
+        q=lambda k: x if k == 0 else (2*k + 1) * x * x,
+        a=lambda k: 1,
+        terms=lambda dps: int(dps / (2 * math.log10(x))) + 2,
+        finish=lambda T, Q: T / Q)
+
+
+_ARCCOT_5 = _arccot_series(5)
+_ARCCOT_239 = _arccot_series(239)
+
+_E_BROTHERS = SeriesEngine(  # e = ∑ (2k+2)/(2k+1)!
+    p=lambda k: 1,
+    q=lambda k: 1 if k == 0 else 2*k * (2*k + 1),
+    a=lambda k: 2*k + 2,
+    terms=lambda dps: _factorial_terms(dps) // 2 + 2,
+    finish=lambda T, Q: T / Q)
+
+_ZETA3_APERY = SeriesEngine(  # ζ(3) = 5/2 ∑ₖ₌₁ (-1)ᵏ⁻¹/(k³ C(2k,k))
+    p=lambda k: 1 if k == 0 else -k**3,
+    q=lambda k: 2 if k == 0 else 2 * (k + 1)**2 * (2*k + 1),
+    a=lambda k: 1,
+    terms=lambda dps: int(dps / math.log10(4)) + 2,
+    finish=lambda T, Q: 5 * T / (2 * Q))
+
+_LOG2_SERIES = SeriesEngine(  # ln 2 = ∑ₖ₌₁ 1/(k 2ᵏ)
+    p=lambda k: 1 if k == 0 else k,
+    q=lambda k: 2 if k == 0 else 2 * (k + 1),
+    a=lambda k: 1,
+    terms=lambda dps: int(dps / math.log10(2)) + 2,
+    finish=lambda T, Q: T / Q)
+
+
+def _series(engine, dps):
+    return engine.run(dps, _Checkpointer(None, None, None, engine.kind, None))
+
+
+def _machin_pi(dps):
+    return 16 * _series(_ARCCOT_5, dps) - 4 * _series(_ARCCOT_239, dps)
+
+
+VERIFIERS = {
+    "Pi": ("Machin arctangent formula", _machin_pi),
+    "Bailey–Borwein–Plouffe Constant": ("Machin arctangent formula", _machin_pi),
+    "Euler’s Number": ("Brothers' series ∑(2k+2)/(2k+1)!", lambda dps: _series(_E_BROTHERS, dps)),
+    "Apéry’s Constant": ("Apéry's central binomial series", lambda dps: _series(_ZETA3_APERY, dps)),
+    "Lévy’s Constant": ("Machin π with ∑1/(k·2ᵏ) for ln 2",
+                        lambda dps: _machin_pi(dps)**2 / (12 * _series(_LOG2_SERIES, dps))),
+    "Catalan’s Constant": ("Trigamma identity (ψ₁(1/4) − π²)/8",
+                           lambda dps: (mp.psi(1, mp.mpf(1) / 4) - _machin_pi(dps)**2) / 8),
+    "Gauss’s Constant": ("Γ(1/4)²/(2π)^(3/2)",
+                         lambda dps: mp.gamma(mp.mpf(1) / 4)**2 / (2 * _machin_pi(dps))**1.5),
+    "Golden Ratio": ("(1 + exp(ln 5 / 2))/2", lambda dps: (1 + mp.exp(mp.log(5) / 2)) / 2),
+    "Square Root of 2": ("exp(ln 2 / 2)", lambda dps: mp.exp(_series(_LOG2_SERIES, dps) / 2)),
+    "Square Root of 3": ("exp(ln 3 / 2)", lambda dps: mp.exp(mp.log(3) / 2)),
+    "Omega Constant": ("Newton root of x·eˣ = 1",
+                       lambda dps: mp.findroot(lambda x: x * mp.exp(x) - 1, mp.mpf('0.567'))),
+    "Gelfond’s Constant": ("exp of Machin π", lambda dps: mp.exp(_machin_pi(dps))),
+    "Ramanujan Constant": ("exp of Machin π·√163",
+                           lambda dps: mp.exp(_machin_pi(dps) * mp.sqrt(163))),
+}
+
+_verification_pool = None
+
+
+def verification_pool():
+    # Separate processes so the second formula really runs alongside the primary one
+    global _verification_pool
+    if _verification_pool is None:
+        # Spawned, not forked: the pool is first used from Qt worker threads
+        _verification_pool = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) - 1),
+                                                 mp_context=multiprocessing.get_context('spawn'))
+    return _verification_pool
+
+
+def run_verifier(name, precision):
+    dps = working_dps(precision)
+    with mp.workdps(dps):
+        value = VERIFIERS[name][1](dps)
+    return format_value(value, precision)
+
+
+def _verifier_child(conn, name, precision):
+    try:
+        conn.send((True, run_verifier(name, precision)))
+    except Exception as e:
+        conn.send((False, str(e)))
+
+
+class VerifierProcess:
+    # A verifier in a process of its own, so a superseded GUI calculation can
+    # kill it; a running pool future cannot be cancelled
+    def __init__(self, name, precision):
+        context = multiprocessing.get_context('spawn')  # Forking a Qt process is unsafe
+        self._receiver, sender = context.Pipe(duplex=False)
+        self._process = context.Process(target=_verifier_child, args=(sender, name, precision),
+                                        daemon=True)
+        self._process.start()
+        sender.close()
+        self._cancelled = False
+
+    def result(self):
+        try:
+            ok, value = self._receiver.recv()
+        except EOFError:
+            if self._cancelled:
+                raise CalculationCancelled() from None
+            raise ValueError("Verifier process exited without a result") from None
+        if not ok:
+            raise ValueError(f"Verifier failed: {value}")
+        return value
+
+    def cancel(self):
+        self._cancelled = True
+        if self._process.is_alive():
+            self._process.terminate()
+
+
+def _significant_digits(text):
+    mantissa = text.lower().split('e')[0]
+    return len(mantissa.lstrip('-0.').replace('.', ''))
+
+
+def compare_results(name, result, check):
+    length = 0
+    for x, y in zip(result, check):
+        if x != y:
+            break
+        length += 1
+    agreed = result[:length]
+    return {
+        'verifier': VERIFIERS[name][0],
+        'verified_digits': _significant_digits(agreed),
+        'total_digits': _significant_digits(result),
+        'sha256': hashlib.sha256(agreed.encode('utf-8')).hexdigest(),
+    }
+
+
+def describe_verification(meta):
+    verified, total = meta['verified_digits'], meta['total_digits']
+    if verified < total:
+        text = f"⚠ Only {verified:,} of {total:,} digits agree with {meta['verifier']}"
+    else:
+        text = f"Verified {verified:,} digits against {meta['verifier']}"
+    return f"{text} · sha256 {meta['sha256'][:16]}"
+
+
+# ======================================================================
+# Continued Fractions
+# ======================================================================
+
+CF_LEAF_BITS = 512  # Below this, plain Euclid steps beat splitting
+CF_CHUNK = 2000  # Partial quotients per streamed chunk
+CF_GUARD_BITS = 64  # Remainder bits above the error bound finished one quotient at a time
+
+# A 2x2 matrix [[p, p'], [q, q']] of consecutive convergents is kept as (p, p', q, q').
+_CF_IDENTITY = (1, 0, 0, 1)
+
+
+def _cf_mul(m, n):
+    return (m[0]*n[0] + m[1]*n[2], m[0]*n[1] + m[1]*n[3],
+            m[2]*n[0] + m[3]*n[2], m[2]*n[1] + m[3]*n[3])
+
+
+def _cf_matrix(quotients):
+    if len(quotients) == 1:
+        q = quotients[0]
+        return (q, 1, 1, 0)
+    if not quotients:
+        return _CF_IDENTITY
+    mid = len(quotients) // 2
+    return _cf_mul(_cf_matrix(quotients[:mid]), _cf_matrix(quotients[mid:]))
+
+
+def _cf_apply(m, x, y):
+    # Inverse of m applied to (x, y): the remainder pair after m's quotients
+    det = m[0]*m[3] - m[1]*m[2]
+    return det * (m[3]*x - m[1]*y), det * (m[0]*y - m[2]*x)
+
+
+def _cf_pop(m, q):
+    # m with its last quotient q divided back out
+    return (m[1], m[0] - q*m[1], m[3], m[2] - q*m[3])
+
+
+def _cf_reduce(a, b, stop=0):
+    # Euclid quotients of a/b (a > b >= 0) until the remainders reach about
+    # half of a's bits, or `stop` bits. Half-gcd style: each half is reduced
+    # on the top bits of the pair and applied to the full pair as one matrix.
+    # Returns (quotients, m, a', b') with (a, b) = m·(a', b').
+    n = a.bit_length()
+    half = max(stop, n // 2)
+    quotients, (p, pp, q, qq) = [], _CF_IDENTITY
+    if n > CF_LEAF_BITS:
+        m = _CF_IDENTITY
+        for target in ((n + half) // 2, half):
+            if not b or b.bit_length() <= target:
+                break
+            shift = max(0, 2 * target - a.bit_length())
+            part, step, _, _ = _cf_reduce(a >> shift, b >> shift, target - shift)
+            x, y = _cf_apply(step, a, b)
+            # (a, b) = m·(x, y) with x > y >= 0 holds exactly when every quotient
+            # in m is right; the top bits can get the last one or two wrong
+            while part and not x > y >= 0:
+                k = part.pop()
+                x, y = k*x + y, x
+                step = _cf_pop(step, k)
+            if not part:
+                k, r = divmod(a, b)
+                part, step, x, y = [k], (k, 1, 1, 0), b, r
+            quotients += part
+            m, a, b = _cf_mul(m, step), x, y
+        p, pp, q, qq = m
+    while b and b.bit_length() > half:
+        k, r = divmod(a, b)
+        quotients.append(k)
+        a, b = b, r
+        p, pp, q, qq = p*k + pp, p, q*k + qq, q
+    return quotients, (p, pp, q, qq), a, b
+
+
+def _cf_pieces(a, b, err, stop=0):
+    # Partial quotients shared by every a/(b + d) with |d| <= err. The fast
+    # reduction runs on a/b down to `stop` bits and the interval is checked
+    # once per piece; the last few quotients are then taken one at a time.
+    def decided(m, x, y):
+        # d moves the remainder pair by d·(-m[1], m[0]) up to sign; x > y > 0 must hold
+        return y > err * m[0] and x - y > err * (m[0] + m[1])
+
+    m = _CF_IDENTITY
+    while b and a.bit_length() > stop:
+        quotients, step, x, y = _cf_reduce(a, b, stop)
+        if not quotients:
+            break
+        step = _cf_mul(m, step)
+        undecided = False
+        while quotients and not decided(step, x, y):
+            k = quotients.pop()
+            x, y = k*x + y, x
+            step = _cf_pop(step, k)
+            undecided = True
+        if quotients:
+            yield quotients
+        if undecided:
+            return
+        m, a, b = step, x, y
+    while b:
+        k, r = divmod(a, b)
+        step = (m[0]*k + m[1], m[0], m[2]*k + m[3], m[2])
+        if not decided(step, b, r):
+            return
+        yield [k]
+        m, a, b = step, b, r
+
+
+def _cf_rational(value):
+    # The mpf as an exact fraction a/b with b a power of two
+    man, exp = value.man_exp
+    if value._mpf_[0]:
+        man = -man  # man_exp drops the sign; q0 = floor(x) must be negative for x < 0
+    return (man << exp, 1) if exp >= 0 else (man, 1 << -exp)
+
+
+def euclid_quotients(value, count):
+    # Reference for benchmarks: one divmod per quotient, quadratic overall
+    a, b = _cf_rational(value)
+    quotients = []
+    while b and len(quotients) < count:
+        k, r = divmod(a, b)
+        quotients.append(k)
+        a, b = b, r
+    return quotients
+
+
+def continued_fraction(value, precision, limit=None):
+    # Yields (quotients, stats) chunks of the continued fraction of an mpf whose
+    # first `precision` digits are correct; stops where they no longer decide it.
+    a, b = _cf_rational(value)
+    err = 1 << max(0, abs(a).bit_length() - int(precision * math.log2(10)) + 1)
+    q0, r = divmod(a, b)
+    stats = {'terms': 1, 'log_sum': 0.0, 'khinchin': None, 'levy': None}
+    yield [q0], dict(stats)
+    if r - err <= 0 or limit == 1:
+        return
+
+    # Quotients stay decided until the remainders shrink to about the geometric
+    # mean of b and err; the fast reduction stops a guard margin before that
+    stop = (b.bit_length() + err.bit_length()) // 2 + CF_GUARD_BITS
+    if limit is not None:
+        stop = max(stop, b.bit_length() - 2 * limit - CF_GUARD_BITS)  # ~1.7 bits per quotient
+    m = _CF_IDENTITY
+    pending = []
+    for chunk in _cf_pieces(b, r, err, stop):
+        if limit is not None:
+            chunk = chunk[:limit - stats['terms']]
+        for q in chunk:
+            stats['log_sum'] += math.log(q)
+        stats['terms'] += len(chunk)
+        m = _cf_mul(m, _cf_matrix(chunk))
+        n = stats['terms'] - 1
+        stats['khinchin'] = math.exp(stats['log_sum'] / n)
+        stats['levy'] = math.log(m[2]) / n
+        pending.extend(chunk)
+        while len(pending) >= CF_CHUNK:
+            yield pending[:CF_CHUNK], dict(stats)
+            pending = pending[CF_CHUNK:]
+        if limit is not None and stats['terms'] >= limit:
+            break
+    if pending:
+        yield pending, dict(stats)
+
+
+def describe_cf_stats(stats):
+    if not stats.get('khinchin'):
+        return f"{stats['terms']:,} partial quotients"
+    return (f"{stats['terms']:,} partial quotients · geometric mean {stats['khinchin']:.6f} "
+            f"(Khinchin 2.685452) · ln(qₙ)/n {stats['levy']:.6f} (Lévy 1.186569)")
+
+
+# ======================================================================
+# Digit Statistics
+# ======================================================================
+
+np = _LazyModule('numpy', optional=True)
+
+ANALYSIS_CHUNK = 1 << 22  # Digits per vectorised pass
+SEARCH_LIMIT = 1000  # Match positions kept per search
+
+
+def _require_numpy():
+    if not np:
+        raise RuntimeError("Digit analysis needs NumPy (pip install numpy)")
+
+
+def _run_start(buffer, end):
+    # Start of the run of ASCII digits ending at `end`, scanned back a chunk at a time
+    start = end
+    while start:
+        low = max(0, start - ANALYSIS_CHUNK)
+        chunk = np.asarray(buffer[low:start])
+        other = np.flatnonzero((chunk < 48) | (chunk > 57))
+        if len(other):
+            return low + int(other[-1]) + 1
+        start = low
+    return 0
+
+
+def _trailing_digits(buffer):
+    # The digits after the decimal point are the last run of ASCII digits,
+    # past trailing whitespace and any exponent; headers before them are ignored
+    end = len(buffer)
+    while end and buffer[end - 1] in b' \t\r\n':
+        end -= 1
+    start = _run_start(buffer, end)
+    sign = start - 1 if start and buffer[start - 1] in b'+-' else start
+    if start < end and sign and buffer[sign - 1] in b'eE':
+        end = sign - 1
+        start = _run_start(buffer, end)
+    if start == end:
+        raise ValueError("No digits found; expected a value such as 3.14159...")
+    return buffer[start:end]
+
+
+def digits_from_text(text):
+    # ASCII uint8 view of the digits after the decimal point
+    _require_numpy()
+    return _trailing_digits(np.frombuffer(text.encode('ascii', 'replace'), dtype=np.uint8))
+
+
+def digits_from_file(path):
+    _require_numpy()
+    if not os.path.getsize(path):
+        raise ValueError(f"{path} is empty")
+    return _trailing_digits(np.memmap(path, dtype=np.uint8, mode='r'))
+
+
+def _chi_square(counts):
+    expected = counts.sum() / len(counts)
+    if not expected:
+        return 0.0, 1.0
+    stat = float(((counts - expected)**2).sum() / expected)
+    p = float(mp.gammainc((len(counts) - 1) / 2, stat / 2, mp.inf, regularized=True))
+    return stat, p
+
+
+def analyze_digits(buffer, search=None, block=3):
+    _require_numpy()
+    if search and not (search.isascii() and search.isdigit()):
+        raise ValueError(f"Search for a digit string such as 999999, not '{search}'")
+    n = len(buffer)
+    frequencies = np.zeros(10, dtype=np.int64)
+    pairs = np.zeros(100, dtype=np.int64)
+    blocks = np.zeros(10**block, dtype=np.int64)
+    runs = np.zeros(1, dtype=np.int64)
+    longest = (0, None, 0)
+    pattern = np.frombuffer(search.encode('ascii'), dtype=np.uint8) - 48 if search else None
+    positions, matches = [], 0
+    weights = 10**np.arange(block - 1, -1, -1, dtype=np.int64)
+
+    previous = np.zeros(0, dtype=np.uint8)  # Digits before this chunk, for boundary-spanning counts
+    keep = max(1, len(pattern) - 1) if pattern is not None else 1
+    run_digit, run_start, run_length = None, 0, 0
+    chunk_size = max(block, ANALYSIS_CHUNK - ANALYSIS_CHUNK % block)
+    for start in range(0, n, chunk_size):
+        chunk = np.asarray(buffer[start:start + chunk_size]) - np.uint8(48)
+        frequencies += np.bincount(chunk, minlength=10)
+
+        joined = np.concatenate((previous[-1:], chunk))
+        pairs += np.bincount(10 * joined[:-1].astype(np.int64) + joined[1:], minlength=100)
+
+        whole = len(chunk) - len(chunk) % block
+        if whole:
+            codes = chunk[:whole].reshape(-1, block).astype(np.int64) @ weights
+            blocks += np.bincount(codes, minlength=10**block)
+
+        # Runs of equal digits; the last run may continue into the next chunk
+        bounds = np.concatenate(([0], np.flatnonzero(chunk[1:] != chunk[:-1]) + 1, [len(chunk)]))
+        lengths = np.diff(bounds)
+        starts = start + bounds[:-1]
+        if run_digit is not None and chunk[0] == run_digit:
+            lengths[0] += run_length
+            starts[0] = run_start
+        elif run_digit is not None:
+            runs, longest = _close_run(runs, longest, run_length, run_digit, run_start)
+        if len(lengths) > 1:
+            done = lengths[:-1]
+            runs = _add_run(runs, done)
+            top = int(np.argmax(done))
+            if done[top] > longest[0]:
+                longest = (int(done[top]), int(chunk[bounds[top]]), int(starts[top]) + 1)
+        run_digit, run_start, run_length = int(chunk[-1]), int(starts[-1]), int(lengths[-1])
+
+        if pattern is not None and len(pattern):
+            window = np.concatenate((previous[len(previous) - len(pattern) + 1:], chunk))
+            offset = start - (len(window) - len(chunk))
+            count = len(window) - len(pattern) + 1
+            if count > 0:
+                hits = window[:count] == pattern[0]
+                for j in range(1, len(pattern)):
+                    hits &= window[j:count + j] == pattern[j]
+                found = np.flatnonzero(hits)
+                matches += len(found)
+                room = SEARCH_LIMIT - len(positions)
+                positions.extend((found[:room] + offset + 1).tolist())
+        previous = np.concatenate((previous, chunk))[-keep:]
+
+    if run_digit is not None:
+        runs, longest = _close_run(runs, longest, run_length, run_digit, run_start)
+
+    return {
+        'count': n,
+        'frequencies': frequencies,
+        'chi2_digits': _chi_square(frequencies),
+        'pairs': pairs,
+        'chi2_pairs': _chi_square(pairs),
+        'block': block,
+        'blocks': blocks,
+        'chi2_blocks': _chi_square(blocks),
+        'runs': runs,
+        'longest_run': longest,
+        'search': search,
+        'positions': positions,
+        'matches': matches,
+    }
+
+
+def _add_run(runs, lengths):
+    counts = np.bincount(np.atleast_1d(lengths))
+    if len(counts) > len(runs):
+        runs = np.concatenate((runs, np.zeros(len(counts) - len(runs), dtype=np.int64)))
+    runs[:len(counts)] += counts
+    return runs
+
+
+def _close_run(runs, longest, length, digit, start):
+    runs = _add_run(runs, length)
+    if length > longest[0]:
+        longest = (length, digit, start + 1)
+    return runs, longest
+
+
+def describe_analysis(stats):
+    n = stats['count']
+    lines = [f"Digits analysed: {n:,}", "", "Digit frequencies:"]
+    for digit, count in enumerate(stats['frequencies']):
+        lines.append(f"  {digit}: {count:>12,}  ({count / max(n, 1):.6f})")
+    for label, key in (("digits", 'chi2_digits'), ("pairs", 'chi2_pairs'),
+                       (f"{stats['block']}-digit blocks", 'chi2_blocks')):
+        stat, p = stats[key]
+        lines.append(f"χ² {label}: {stat:.3f} (p = {p:.4f})")
+    pairs = stats['pairs']
+    lines.append(f"Pairs: most {int(pairs.argmax()):02d} ×{pairs.max():,} · "
+                 f"least {int(pairs.argmin()):02d} ×{pairs.min():,}")
+    length, digit, position = stats['longest_run']
+    lines.append(f"Longest run: {length} × '{digit}' at digit {position:,}")
+    runs = stats['runs']
+    lines.append("Runs by length: " + ", ".join(
+        f"{length}: {count:,}" for length, count in enumerate(runs) if length and count))
+    if stats['search']:
+        shown = ", ".join(f"{p:,}" for p in stats['positions'][:20])
+        more = " …" if stats['matches'] > 20 else ""
+        lines.append(f"'{stats['search']}' found {stats['matches']:,} times"
+                     + (f" at digit {shown}{more}" if shown else ""))
+    return "\n".join(lines)
+
+
+# ======================================================================
+# Integer-Relation Search
+# ======================================================================
+
+IDENTIFY_SCREEN_DPS = 30  # Cheap first pass over every trial
+IDENTIFY_CONFIRM_DPS = 100  # A screened relation must still hold here
+IDENTIFY_MIN_DIGITS = 40
+IDENTIFY_MAX_COEFF = 1000
+IDENTIFY_DEGREE = 4  # Highest polynomial degree tried for algebraic numbers
+IDENTIFY_PRIMES = (2, 3, 5)
+IDENTIFY_BATCH = 64  # Trials per process-pool task
+IDENTIFY_MAGNITUDE = 10**3  # Basis values outside [1/M, M] would swamp PSLQ's tolerance
+
+# A trial is (kind, terms), terms being (catalog name, power) pairs:
+#   'algebraic'  1, x, x², ... up to the degree given by len(terms)
+#   'linear'     x, 1, terms...            → x = p + q·c₁ + r·c₂
+#   'product'    log x, log terms..., log primes → x = c^a · 2^b · 3^c · 5^d
+
+_identify_values = {}  # dps -> {(name, power): value}, per process
+
+
+def _basis_value(name, power, dps):
+    values = _identify_values.setdefault(dps, {})
+    if (name, power) not in values:
+        with mp.workdps(dps + 10):
+            base = values.get((name, 1))
+            if base is None:
+                base = load_constants()[name]['func']()
+            values[(name, power)] = +(base ** power)
+    return values[(name, power)]
+
+
+def identification_basis(exclude=()):
+    # Mathematical catalog entries of moderate size the registry computes to full
+    # precision (not rounded literals), with numerically equal entries such as BBP/Pi
+    # kept once. Physical constants carry units and are left out.
+    basis, seen = [], []
+    with mp.workdps(IDENTIFY_CONFIRM_DPS):
+        for name, constant_data in load_constants().items():
+            try:
+                value = +constant_data['func']()
+            except Exception:
+                continue
+            if not isinstance(value, mp.mpf):
+                continue
+            if not 1 / IDENTIFY_MAGNITUDE <= abs(value) <= IDENTIFY_MAGNITUDE:
+                continue
+            if _significant_digits(mp.nstr(value, IDENTIFY_CONFIRM_DPS)) < IDENTIFY_CONFIRM_DPS - 5:
+                continue
+            equal = any(abs(value - other) <= abs(value) * mp.mpf(10)**(10 - IDENTIFY_CONFIRM_DPS)
+                        for other in seen)
+            seen.append(value)
+            if not equal and name not in exclude and name not in CODATA_SYMBOLS:
+                basis.append(name)
+    return basis
+
+
+def identification_trials(basis):
+    terms = [(name, 1) for name in basis] + [(name, 2) for name in basis]
+    trials = [('algebraic', (None,) * degree) for degree in range(1, IDENTIFY_DEGREE + 1)]
+    trials.append(('product', ()))
+    trials += [('linear', (term,)) for term in terms]
+    trials += [('product', ((name, 1),)) for name in basis]
+    trials += [('linear', (a, b)) for i, a in enumerate(terms) for b in terms[i + 1:]
+               if a[0] != b[0]]
+    return trials
+
+
+def _relation_vector(kind, terms, x, dps):
+    if kind == 'algebraic':
+        return [x**k for k in range(len(terms) + 1)]
+    if kind == 'linear':
+        return [x, mp.mpf(1)] + [_basis_value(name, power, dps) for name, power in terms]
+    if x <= 0 or any(_basis_value(name, power, dps) <= 0 for name, power in terms):
+        return None
+    return ([mp.log(x)] + [mp.log(_basis_value(name, power, dps)) for name, power in terms]
+            + [mp.log(p) for p in IDENTIFY_PRIMES])
+
+
+def _involves_x(kind, relation):
+    return any(relation[1:]) if kind == 'algebraic' else relation[0] != 0
+
+
+def _screen_trials(x_text, trials, dps):
+    # Runs in the process pool: returns the trials that have a small relation
+    hits = []
+    with mp.workdps(dps):
+        x = mp.mpf(x_text)
+        for kind, terms in trials:
+            vector = _relation_vector(kind, terms, x, dps)
+            if vector is None:
+                continue
+            try:
+                relation = mp.pslq(vector, maxcoeff=IDENTIFY_MAX_COEFF, maxsteps=2000)
+            except ValueError:
+                continue  # Entries too small to register at this precision
+            if relation and _involves_x(kind, relation):
+                hits.append((kind, terms, relation))
+    return hits
+
+
+def _confirm_relation(x_text, kind, terms, relation, dps):
+    # Certified when the residual is at the working precision, far below
+    # anything coefficients of this size could produce by accident
+    with mp.workdps(dps):
+        vector = _relation_vector(kind, terms, mp.mpf(x_text), dps)
+        residual = abs(mp.fsum(a * v for a, v in zip(relation, vector)))
+        return residual <= mp.fsum(abs(a * v) for a, v in zip(relation, vector)) * mp.mpf(10)**(10 - dps)
+
+
+def _term_label(term):
+    name, power = term
+    return name if power == 1 else f"({name})^{power}"
+
+
+def format_relation(kind, terms, relation):
+    if kind == 'algebraic':
+        if [a for a in relation if a][-1] < 0:
+            relation = [-a for a in relation]  # Positive leading coefficient
+        parts = [(a, "1" if k == 0 else "x" if k == 1 else f"x^{k}") for k, a in enumerate(relation)]
+        parts = [(Fraction(a), label) for a, label in reversed(parts) if a]
+        return _join_terms(parts) + " = 0"
+    a0 = relation[0]
+    if kind == 'linear':
+        labels = [_term_label(term) for term in terms] + ["1"]
+        coefficients = relation[2:] + relation[1:2]  # Constant term last
+        parts = [(Fraction(-a, a0), label) for a, label in zip(coefficients, labels) if a]
+        return "x = " + (_join_terms(parts) if parts else "0")
+    labels = [_term_label(term) for term in terms] + [str(p) for p in IDENTIFY_PRIMES]
+    factors = [label if e == 1 else f"{label}^{e}" if e.denominator == 1 else f"{label}^({e})"
+               for e, label in ((Fraction(-a, a0), label) for a, label in zip(relation[1:], labels) if a)]
+    return "x = " + (" · ".join(factors) if factors else "1")
+
+
+def _join_terms(parts):
+    text = ""
+    for coefficient, label in parts:
+        sign = "-" if coefficient < 0 else "+"
+        size = abs(coefficient)
+        body = str(size) if label == "1" else label if size == 1 else f"{size}·{label}"
+        text += f" {sign} {body}" if text else ("-" if sign == "-" else "") + body
+    return text
+
+
+def identify(x_text, exclude=(), progress=None, should_stop=None):
+    digits = _significant_digits(x_text)
+    if digits < IDENTIFY_MIN_DIGITS:
+        raise ValueError(f"Identification needs at least {IDENTIFY_MIN_DIGITS} digits, got {digits}")
+    # Only the leading digits are used; do not ship a long result to every task
+    mantissa, _, exponent = x_text.strip().lower().partition('e')
+    x_text = mantissa[:IDENTIFY_CONFIRM_DPS + 20] + (f"e{exponent}" if exponent else "")
+    confirm_dps = min(digits - 5, IDENTIFY_CONFIRM_DPS)
+    trials = identification_trials(identification_basis(exclude))
+    batches = [trials[i:i + IDENTIFY_BATCH] for i in range(0, len(trials), IDENTIFY_BATCH)]
+    # Futures are read in submission order, so simpler trials win ties
+    futures = [verification_pool().submit(_screen_trials, x_text, batch, IDENTIFY_SCREEN_DPS)
+               for batch in batches]
+    screened = 0
+    try:
+        for batch, future in zip(batches, futures):
+            if should_stop and should_stop():
+                raise CalculationCancelled()
+            for kind, terms, relation in future.result():
+                if _confirm_relation(x_text, kind, terms, relation, confirm_dps):
+                    return {
+                        'relation': format_relation(kind, terms, relation),
+                        'kind': kind,
+                        'coefficients': relation,
+                        'digits': confirm_dps,
+                        'trials': screened + len(batch),
+                        'total': len(trials),
+                    }
+            screened += len(batch)
+            if progress:
+                progress(screened, len(trials))
+    finally:
+        for future in futures:
+            future.cancel()
+    return {'relation': None, 'trials': screened, 'total': len(trials)}
+
+
+def describe_identification(result):
+    if result['relation'] is None:
+        return (f"No relation with coefficients up to {IDENTIFY_MAX_COEFF} "
+                f"({result['total']:,} trials)")
+    return (f"{result['relation']}  (holds to {result['digits']} digits; "
+            f"found within the first {result['trials']:,} of {result['total']:,} trials)")
+
+
+# ======================================================================
+# Resource Governor
+# ======================================================================
+
+MEMORY_BUDGET_ENV = "CONSTANT_Z_MEMORY_BUDGET"
+RSS_SAMPLE_INTERVAL = 0.25  # Seconds between RSS samples while jobs run
+BACKEND_OPERANDS = {'mpmath': WORKING_OPERANDS, 'engine': WORKING_OPERANDS, 'flint': 6}
+
+
+class MemoryBudgetError(Exception):
+    pass
+
+
+def parse_size(text):
+    text = text.strip().upper().rstrip('B')
+    multipliers = {'K': 1024, 'M': 1024**2, 'G': 1024**3, 'T': 1024**4}
+    suffix = text[-1:] if text[-1:] in multipliers else ''
+    return int(float(text[:-1] if suffix else text) * multipliers.get(suffix, 1))
+
+
+def current_rss():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    return peak_rss()  # Peak rather than current RSS
+
+
+def peak_rss():
+    try:
+        import resource
+    except ImportError:
+        return None
+    # In KB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def default_memory_budget():
+    if os.environ.get(MEMORY_BUDGET_ENV):
+        return parse_size(os.environ[MEMORY_BUDGET_ENV])
+    available = available_memory()
+    return int(available * MEMORY_HEADROOM) if available else None
+
+
+def estimate_job_memory(backend, precision, out_of_core=False, verify=False):
+    if out_of_core:
+        return estimate_memory(precision, out_of_core=True)
+    operands = BACKEND_OPERANDS.get(backend, WORKING_OPERANDS)
+    estimate = int(precision * BYTES_PER_DIGIT * operands) + 2 * precision
+    if verify:
+        estimate += estimate_memory(precision)  # The verifier process does a full run too
+    return estimate
+
+
+class ResourceGovernor:
+    # Reserves estimated memory per job, queues jobs that do not fit and
+    # samples process RSS while anything is running. RSS is that of this
+    # process alone, shared by concurrent jobs; worker processes are not seen.
+    def __init__(self, budget=None):
+        self.budget = budget if budget is not None else default_memory_budget()
+        self.baseline = current_rss() or 0
+        self.jobs = {}
+        self._next_id = 0
+        self._sampler = None
+        self._cond = threading.Condition()
+
+    def committed(self):
+        reserved = sum(job['estimate'] for job in self.jobs.values())
+        rss = current_rss()
+        return max(reserved, rss - self.baseline) if rss else reserved
+
+    def check(self, estimate, label):
+        if self.budget is not None and estimate > self.budget:
+            raise MemoryBudgetError(
+                f"{label} needs ~{format_bytes(estimate)}, more than the "
+                f"{format_bytes(self.budget)} memory budget")
+
+    def _fits(self, estimate):
+        return self.budget is None or not self.jobs or self.committed() + estimate <= self.budget
+
+    def try_reserve(self, estimate, label):
+        self.check(estimate, label)
+        with self._cond:
+            if not self._fits(estimate):
+                return None
+            return self._add(estimate, label)
+
+    def reserve(self, estimate, label):
+        self.check(estimate, label)
+        with self._cond:
+            self._cond.wait_for(lambda: self._fits(estimate))
+            return self._add(estimate, label)
+
+    def _add(self, estimate, label):
+        self._next_id += 1
+        self.jobs[self._next_id] = {'label': label, 'estimate': estimate,
+                                    'peak_rss': current_rss() or 0}
+        if self._sampler is None:
+            self._sampler = threading.Thread(target=self._sample, daemon=True)
+            self._sampler.start()
+        return self._next_id
+
+    def peak_rss(self, job_id):
+        with self._cond:
+            job = self.jobs.get(job_id)
+            return max(job['peak_rss'], current_rss() or 0) if job else None
+
+    def release(self, job_id):
+        with self._cond:
+            job = self.jobs.pop(job_id, None)
+            self._cond.notify_all()
+        return job
+
+    def _sample(self):
+        while True:
+            with self._cond:
+                if not self.jobs:
+                    self._sampler = None
+                    return
+                rss = current_rss() or 0
+                for job in self.jobs.values():
+                    job['peak_rss'] = max(job['peak_rss'], rss)
+            time.sleep(RSS_SAMPLE_INTERVAL)
+
+    def describe(self):
+        if self.budget is None:
+            return "Memory budget: unlimited"
+        return (f"Memory: {format_bytes(self.committed())} of "
+                f"{format_bytes(self.budget)} budget in use · {len(self.jobs)} job(s)")
+
+
+# ======================================================================
+# Calculation Worker Thread
+# ======================================================================
+
+class CalculationThread(QThread):
+    update_progress = pyqtSignal(int, str)
+    result_ready = pyqtSignal(str, str, object)
+    cf_chunk = pyqtSignal(object, object)
+
+    def __init__(self, name, constant_data, precision, backends, backend=None,
+                 out_of_core=False, verify=False, governor=None, job=None,
+                 continued_fraction=False):
+        super().__init__()
+        self.name = name
+        self.constant_data = constant_data
+        self.precision = precision
+        self.backends = backends
+        self.backend = backend
+        self.out_of_core = out_of_core
+        self.continued_fraction = continued_fraction
+        self.verify = verify and name in VERIFIERS and not out_of_core and not continued_fraction
+        self.governor = governor
+        self.job = job
+        self.check = None
+        self._is_running = True
+
+    def run(self):
+        try:
+            for progress in self._simulate_calculation():
+                if not self._is_running:
+                    return
+                self.update_progress.emit(progress, self.constant_data['formula'])
+            # A stopped calculation may still be inside mpmath; wait for it
+            while not PRECISION_LOCK.acquire(timeout=0.1):
+                if not self._is_running:
+                    return
+            try:
+                result, meta = self._calculate()
+            finally:
+                PRECISION_LOCK.release()
+            if self.check:
+                meta.update(compare_results(self.name, result, self.check.result()))
+            if self.governor:
+                meta['peak_rss'] = self.governor.peak_rss(self.job)
+            self.result_ready.emit(result, self.constant_data['formula'], meta)
+        except CalculationCancelled:
+            return
+        except Exception as e:
+            self.result_ready.emit(f"⨯ Error: {str(e)}", "", {})
+        finally:
+            if self.check:
+                self.check.cancel()
+            if self.governor:
+                self.governor.release(self.job)
+
+    def _calculate(self):
+        # Started only once the run survived the cancellation window
+        if self.verify:
+            self.check = VerifierProcess(self.name, self.precision)
+
+        start = time.perf_counter()
+        scratch = ScratchSpace() if self.out_of_core else None
+        try:
+            value, backend = self.backends.evaluate(
+                self.name, self.constant_data, self.precision, self.backend,
+                progress=lambda p: self.update_progress.emit(p, self.constant_data['formula']),
+                should_stop=lambda: not self._is_running, scratch=scratch)
+        finally:
+            if scratch:
+                scratch.close()
+        meta = {'backend': backend, 'elapsed': time.perf_counter() - start}
+        if self.continued_fraction:
+            meta['continued_fraction'] = self._stream_continued_fraction(value)
+            result = describe_cf_stats(meta['continued_fraction'])
+        elif self.out_of_core:
+            meta['output'] = result_path(self.name, self.precision)
+            write_digits(value, self.precision, meta['output'])
+            result = read_preview(meta['output'])
+        else:
+            result = format_value(value, self.precision)
+        return result, meta
+
+    def _stream_continued_fraction(self, value):
+        if not isinstance(value, mp.mpf):
+            raise ValueError("Continued fractions need a numeric value")
+        expected = 0.97 * self.precision  # Lochs: ~0.97 partial quotients per digit
+        stats = {}
+        for quotients, stats in continued_fraction(value, self.precision):
+            if not self._is_running:
+                raise CalculationCancelled()
+            self.cf_chunk.emit(quotients, stats)
+            self.update_progress.emit(min(99, int(100 * stats['terms'] / expected)),
+                                      self.constant_data['formula'])
+        return stats
+
+    def _simulate_calculation(self):
+        for i in range(1, 101):
+            time.sleep(0.01)
+            yield i
+
+    def stop(self):
+        self._is_running = False
+        if self.check:
+            self.check.cancel()
+
+class AnalysisThread(QThread):
+    report_ready = pyqtSignal(str)
+
+    def __init__(self, text=None, path=None, search=None):
+        super().__init__()
+        self.text = text
+        self.path = path
+        self.search = search
+
+    def run(self):
+        try:
+            buffer = digits_from_file(self.path) if self.path else digits_from_text(self.text)
+            start = time.perf_counter()
+            with PRECISION_LOCK:  # The chi-square p-values use mpmath
+                stats = analyze_digits(buffer, self.search)
+            report = describe_analysis(stats) + f"\n\n({time.perf_counter() - start:.3f} s)"
+        except Exception as e:
+            report = f"⨯ Error: {str(e)}"
+        self.report_ready.emit(report)
+
+class IdentifyThread(QThread):
+    report_ready = pyqtSignal(str)
+
+    def __init__(self, text, exclude=()):
+        super().__init__()
+        self.text = text
+        self.exclude = exclude
+
+    def run(self):
+        try:
+            with PRECISION_LOCK:
+                report = describe_identification(identify(self.text, self.exclude))
+        except Exception as e:
+            report = f"⨯ Error: {str(e)}"
+        self.report_ready.emit(report)
+
+# ======================================================================
+# Main Application Window
+# ======================================================================
+
+ICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "math_icon.png")
+
+# Parsed by Qt once, in a single setStyleSheet call on the main window
+STYLE_SHEET = """
+    QWidget {
+        background-color: #0d0d0d;
+        color: #00ff7f;
+    }
+    QLineEdit, QTextEdit, QListWidget {
+        background-color: #1a1a1a;
+        border: 2px solid #00ff7f;
+        border-radius: 5px;
+        padding: 10px;
+        font-size: 14px;
+    }
+    QPushButton {
+        background-color: #1a1a1a;
+        border: 2px solid #00ff7f;
+        border-radius: 5px;
+        padding: 8px;
+        min-width: 100px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #262626;
+    }
+    QProgressBar {
+        border: 2px solid #00ff7f;
+        border-radius: 5px;
+        height: 20px;
+    }
+    QProgressBar::chunk {
+        background-color: #00ff7f;
+    }
+    QSplitter::handle {
+        background-color: #00ff7f;
+        width: 2px;
+    }
+    QTextEdit#formula_display {
+        font-size: 18px;
+        font-weight: bold;
+    }
+    QTextEdit#value_display {
+        font-family: 'Consolas';
+        font-size: 14px;
+    }
+    QTextEdit#analysis_display {
+        font-family: 'Consolas';
+        font-size: 13px;
+    }
+    QLabel#info_label {
+        font-size: 16px;
+    }
+"""
+
+
+class ConstantsApp(QMainWindow):
+    first_painted = pyqtSignal(float)
+    startup_finished = pyqtSignal(float)
+
+    def __init__(self):
+        super().__init__()
+        self._constants = None
+        self.painted = False
+        self.backends = BackendSelector()
+        self.governor = ResourceGovernor()
+        self.init_ui()
+        self.current_constant = None
+        self.calculation_thread = None
+        self.stopped_threads = set()
+        self.result_meta = {}
+        self.result_text = None
+        self.verify_note = None
+        self.analysis_thread = None
+        self.identify_thread = None
+        self.calculation_pending = False
+
+
+    @property
+    def constants(self):
+        # The registry is built on first use, after the first frame
+        if self._constants is None:
+            self._constants = self._load_constants()
+        return self._constants
+
+    def _load_constants(self):
+        return load_constants()
+
+
+    # ==================================================================
+    # UI Initialization
+    # ==================================================================
+
+    def init_ui(self):
+        self.setWindowTitle("Ultimate Math Constants Calculator")
+        if os.path.exists(ICON_PATH):
+            self.setWindowIcon(QIcon(ICON_PATH))
+        self.setGeometry(100, 100, 1600, 900)
+
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+
+        # Main layout
+        main_layout = QHBoxLayout(main_widget)
+        main_layout.setContentsMargins(10, 10, 10, 10)
+
+        # Left panel
+        left_panel = QFrame()
+        left_panel.setFrameShape(QFrame.Shape.StyledPanel)
+        left_layout = QVBoxLayout(left_panel)
+        
+        # Search bar
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("🔍 Search 100+ constants...")
+        self.search_bar.textChanged.connect(self.filter_list)
+
+        # User-defined expression
+        self.expression_input = QLineEdit()
+        self.expression_input.setPlaceholderText("ƒ Expression, e.g. zeta(5) or pi^2/6 - 1")
+        self.expression_input.returnPressed.connect(self.add_expression)
+        
+        # Constants list
+        self.constants_list = QListWidget()
+        self.constants_list.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
+        
+        left_layout.addWidget(self.search_bar)
+        left_layout.addWidget(self.expression_input)
+        left_layout.addWidget(self.constants_list)
+
+        # Right panel
+        right_panel = QFrame()
+        right_panel.setFrameShape(QFrame.Shape.StyledPanel)
+        right_layout = QVBoxLayout(right_panel)
+
+        # Info section
+        self.info_label = QLabel("ℹ Select a constant from the list")
+        self.info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        # Formula display
+        self.formula_display = QTextEdit()
+        self.formula_display.setReadOnly(True)
+        
+        # Progress bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(False)
+        
+        # Value display
+        self.value_display = QTextEdit()
+        self.value_display.setReadOnly(True)
+
+        # Digit statistics
+        self.analysis_display = QTextEdit()
+        self.analysis_display.setReadOnly(True)
+        self.analysis_display.hide()
+        
+        # Control panel
+        control_layout = QHBoxLayout()
+        self.precision_input = QLineEdit("1000")
+        self.precision_input.setPlaceholderText("Precision (e.g., 100, 1K, 1M)")
+        self.verify_check = QCheckBox("Verify")
+        self.verify_check.setToolTip("Cross-check with an independent formula in a second process")
+        self.cf_check = QCheckBox("Continued Fraction")
+        self.cf_check.setToolTip("Expand the computed value as a continued fraction")
+        self.copy_btn = QPushButton("📋 Copy Value")
+        self.save_btn = QPushButton("💾 Save Value")
+        self.digit_search = QLineEdit()
+        self.digit_search.setPlaceholderText("Find digits (e.g. 999999)")
+        self.analyze_btn = QPushButton("📊 Analyze Digits")
+        self.identify_btn = QPushButton("🔎 Identify")
+        self.identify_btn.setToolTip("Search for an integer relation with catalog constants")
+        
+        control_layout.addWidget(QLabel("Precision:"))
+        control_layout.addWidget(self.precision_input)
+        control_layout.addWidget(self.verify_check)
+        control_layout.addWidget(self.cf_check)
+        control_layout.addWidget(self.copy_btn)
+        control_layout.addWidget(self.save_btn)
+        control_layout.addWidget(self.digit_search)
+        control_layout.addWidget(self.analyze_btn)
+        control_layout.addWidget(self.identify_btn)
+
+        right_layout.addWidget(self.info_label)
+        right_layout.addWidget(self.formula_display)
+        right_layout.addWidget(self.progress_bar)
+        right_layout.addWidget(self.value_display)
+        right_layout.addWidget(self.analysis_display)
+        right_layout.addLayout(control_layout)
+
+        # Add panels to main layout
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        splitter.addWidget(left_panel)
+        splitter.addWidget(right_panel)
+        splitter.setSizes([300, 1000])
+        main_layout.addWidget(splitter)
+
+        # Connect signals
+        self.constants_list.itemClicked.connect(self.constant_selected)
+        self.precision_input.textChanged.connect(self.start_calculation)
+        self.cf_check.toggled.connect(self.start_calculation)
+        self.copy_btn.clicked.connect(self.copy_value)
+        self.save_btn.clicked.connect(self.save_value)
+        self.analyze_btn.clicked.connect(self.analyze_digits)
+        self.digit_search.returnPressed.connect(self.analyze_digits)
+        self.identify_btn.clicked.connect(self.identify_value)
+
+        self.apply_styles()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.painted:
+            self.painted = True
+            self.first_painted.emit(time.perf_counter())
+            QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
+        # Work the first frame does not need; backends are named with the first result
+        self.populate_list()
+        self.startup_finished.emit(time.perf_counter())
+
+    def apply_styles(self):
+        self.formula_display.setObjectName("formula_display")
+        self.value_display.setObjectName("value_display")
+        self.analysis_display.setObjectName("analysis_display")
+        self.info_label.setObjectName("info_label")
+        self.setStyleSheet(STYLE_SHEET)
+
+    # ==================================================================
+    # Core Functionality
+    # ==================================================================
+
+    def populate_list(self):
+        self.constants_list.clear()
+        for name in self.constants.keys():
+            item = QListWidgetItem(f"✦ {name}")
+            item.setData(Qt.ItemDataRole.UserRole, name)
+            self.constants_list.addItem(item)
+
+    def filter_list(self):
+        search_text = self.search_bar.text().lower()
+        for i in range(self.constants_list.count()):
+            item = self.constants_list.item(i)
+            item.setHidden(search_text not in item.text().lower())
+
+    def constant_selected(self, item):
+        self.current_constant = item.data(Qt.ItemDataRole.UserRole)
+        self.update_info_display()
+        self.start_calculation()
+
+    def add_expression(self):
+        text = self.expression_input.text().strip()
+        if not text:
+            return
+        try:
+            name, constant_data = expression_constant(text)
+        except ValueError as e:
+            self.value_display.setPlainText(f"⨯ {e}")
+            return
+        if name not in self.constants:
+            self.constants[name] = constant_data
+            item = QListWidgetItem(f"✦ {name}")
+            item.setData(Qt.ItemDataRole.UserRole, name)
+            self.constants_list.addItem(item)
+        item = self.constants_list.findItems(f"✦ {name}", Qt.MatchFlag.MatchExactly)[0]
+        self.constants_list.setCurrentItem(item)
+        self.constants_list.scrollToItem(item)
+        self.constant_selected(item)
+
+    def update_info_display(self):
+        constant_data = self.constants[self.current_constant]
+        info_text = f"""
+        <b>{self.current_constant}</b><br>
+        <i>{constant_data['reference']}</i><br>
+        Accuracy: {constant_data['accuracy']}
+        """
+        self.info_label.setText(info_text)
+        self.formula_display.setText(constant_data['formula'])
+
+    def start_calculation(self):
+        if self.current_constant is None:
+            return
+        if self.calculation_thread and self.calculation_thread.isRunning():
+            self.calculation_thread.stop()
+            # Dropping the last reference to a running QThread aborts the process
+            self.stopped_threads.add(self.calculation_thread)
+
+        name = self.current_constant
+        precision = self.parse_precision(self.precision_input.text())
+        try:
+            plan = plan_precision(precision, self.governor.budget, spills_to_disk(name))
+            cf_mode = self.cf_check.isChecked()
+            verify = (self.verify_check.isChecked() and name in VERIFIERS
+                      and not plan['out_of_core'] and not cf_mode)
+            self.verify_note = None
+            if self.verify_check.isChecked() and not verify and not cf_mode:
+                self.verify_note = f"No independent formula for {name}; skipping verification"
+            backend = 'engine' if plan['out_of_core'] else None
+            estimate = estimate_job_memory(self.backends.choose(name, precision, backend),
+                                           precision, plan['out_of_core'], verify)
+            job = self.governor.try_reserve(estimate, f"{name} at {precision:,} digits")
+        except (ValueError, MemoryBudgetError) as e:
+            self.value_display.setPlainText(f"⨯ {e}")
+            return
+        self.result_meta = {}
+        self.result_text = None
+        self.progress_bar.setValue(0)
+        # Stopped workers keep their reservation until mpmath returns; retry when one finishes
+        self.calculation_pending = job is None
+        if job is None:
+            self.value_display.setPlainText(f"⏳ Queued: waiting for memory\n{self.governor.describe()}")
+            return
+        message = f"{describe_plan(plan)} · {self.governor.describe()}"
+        if self.verify_note:
+            message += f" · {self.verify_note}"
+        self.statusBar().showMessage(message)
+        self.value_display.setPlainText("⌛ Calculating...")
+
+        self.calculation_thread = CalculationThread(
+            name,
+            self.constants[name],
+            precision,
+            self.backends,
+            out_of_core=plan['out_of_core'],
+            verify=verify,
+            governor=self.governor,
+            job=job,
+            continued_fraction=cf_mode
+        )
+        self.cf_shown = 0
+        self.calculation_thread.update_progress.connect(self.update_progress)
+        self.calculation_thread.cf_chunk.connect(self.show_cf_chunk)
+        self.calculation_thread.result_ready.connect(self.show_result)
+        self.calculation_thread.finished.connect(self.start_pending_calculation)
+        self.calculation_thread.start()
+
+    def start_pending_calculation(self):
+        self.stopped_threads.discard(self.sender())
+        if self.calculation_pending:
+            self.start_calculation()
+
+    def update_progress(self, value, formula):
+        self.progress_bar.setValue(value)
+        self.formula_display.setText(f"{formula}\n\nProgress: {value}%")
+
+    def show_cf_chunk(self, quotients, stats):
+        if self.sender() is not self.calculation_thread:
+            return
+        if not self.cf_shown:
+            text = f"[{quotients[0]}; " + ", ".join(map(str, quotients[1:]))
+            self.value_display.setPlainText(text)
+        else:
+            self.value_display.moveCursor(QTextCursor.MoveOperation.End)
+            self.value_display.insertPlainText(", " * (self.cf_shown > 1) + ", ".join(map(str, quotients)))
+        self.cf_shown += len(quotients)
+        self.statusBar().showMessage(describe_cf_stats(stats))
+
+    def show_result(self, result, formula, meta):
+        if self.sender() is not self.calculation_thread:
+            return  # Late result from a calculation that was replaced
+        self.progress_bar.setValue(100)
+        if 'continued_fraction' in meta:
+            self.value_display.moveCursor(QTextCursor.MoveOperation.End)
+            self.value_display.insertPlainText(f"]\n\n{result}")
+        else:
+            # Laying out millions of digits freezes the widget; copy and save use result_text
+            self.value_display.setPlainText(text_preview(result) if meta else result)
+            if meta:
+                self.result_text = result
+        self.formula_display.setText(formula)
+        self.value_display.moveCursor(QTextCursor.MoveOperation.Start)
+        self.result_meta = meta
+        if meta:
+            message = f"Backend: {backend_label(meta['backend'])} · {meta['elapsed']:.3f} s"
+            if meta.get('peak_rss'):
+                message += f" · process peak RSS {format_bytes(meta['peak_rss'])}"
+            if 'verified_digits' in meta:
+                message += f" · {describe_verification(meta)}"
+            elif self.verify_note:
+                message += f" · {self.verify_note}"
+            self.statusBar().showMessage(message)
+
+    def analyze_digits(self):
+        path = self.result_meta.get('output')
+        if path is None and self.result_text is None:
+            self.statusBar().showMessage("Compute a constant before analysing its digits")
+            return
+        if self.analysis_thread and self.analysis_thread.isRunning():
+            return
+        self.analysis_display.show()
+        self.analysis_display.setPlainText("⌛ Analysing digits...")
+        self.analysis_thread = AnalysisThread(self.result_text, path,
+                                              self.digit_search.text().strip() or None)
+        self.analysis_thread.report_ready.connect(self.analysis_display.setPlainText)
+        self.analysis_thread.start()
+
+    def identify_value(self):
+        path = self.result_meta.get('output')
+        if path is None and self.result_text is None:
+            self.statusBar().showMessage("Compute a constant before identifying it")
+            return
+        if self.identify_thread and self.identify_thread.isRunning():
+            return
+        if path:
+            with open(path) as f:  # identify() only uses the leading digits
+                text = f.read(IDENTIFY_CONFIRM_DPS + 20)
+        else:
+            text = self.result_text
+        self.analysis_display.show()
+        self.analysis_display.setPlainText("⌛ Searching for an integer relation...")
+        self.identify_thread = IdentifyThread(text, (self.current_constant,))
+        self.identify_thread.report_ready.connect(self.analysis_display.setPlainText)
+        self.identify_thread.start()
+
+    def parse_precision(self, text):
+        return parse_precision(text)
+
+    def copy_value(self):
+        QApplication.clipboard().setText(self.result_text or self.value_display.toPlainText())
+
+    def save_value(self):
+        options = QFileDialog.Option.ReadOnly
+        filename, _ = QFileDialog.getSaveFileName(
+            self, "Save Constant Value", "", 
+            "Text Files (*.txt);;All Files (*)", options=options)
+        if filename:
+            with open(filename, 'w') as f:
+                f.write(f"=== {self.current_constant} ===\n")
+                f.write(f"Formula: {self.constants[self.current_constant]['formula']}\n")
+                f.write(f"Precision: {self.precision_input.text()}\n")
+                if 'verified_digits' in self.result_meta:
+                    f.write(f"Verified: {self.result_meta['verified_digits']} digits "
+                            f"({self.result_meta['verifier']}), "
+                            f"sha256 {self.result_meta['sha256']}\n")
+                f.write("\n")
+                if 'output' in self.result_meta:
+                    # The display only holds a preview of out-of-core results
+                    with open(self.result_meta['output']) as digits:
+                        shutil.copyfileobj(digits, f)
+                else:
+                    f.write(self.result_text or self.value_display.toPlainText())
+
+# ======================================================================
+# Application Entry Point
+# ======================================================================
+
+STARTUP_BUDGET = 1.0  # Seconds from interpreter start of main.py to the first painted frame
+
+
+def measure_startup(app, window, budget=STARTUP_BUDGET):
+    marks = {'window': time.perf_counter()}
+
+    def painted(when):
+        marks['paint'] = when
+        marks['mpmath'] = mp._module is not None
+
+    def catalog_loaded(when):
+        marks['catalog'] = when
+        marks['entries'] = window.constants_list.count()
+        marks['backends'] = bool(mp._module or flint._module)
+        app.quit()
+
+    window.first_painted.connect(painted)
+    window.startup_finished.connect(catalog_loaded)
+    window.show()
+    app.exec()
+    for label, key in (("Window constructed", 'window'), ("First paint", 'paint'),
+                       ("Catalog loaded", 'catalog')):
+        print(f"{label:<20}{marks[key] - _STARTED:8.3f} s")
+    print(f"{'Catalog entries':<20}{marks['entries']:8}")
+    print(f"{'mpmath at paint':<20}{'loaded' if marks['mpmath'] else 'deferred':>8}")
+    print(f"{'Backends at catalog':<20}{'loaded' if marks['backends'] else 'deferred':>8}")
+    first_paint = marks['paint'] - _STARTED
+    if first_paint > budget:
+        print(f"⨯ First paint took {first_paint:.3f} s, over the {budget:.3f} s budget",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+def build_cli():
+    parser = argparse.ArgumentParser(description="Ultimate Math Constants Calculator")
+    commands = parser.add_subparsers(dest='command')
+
+    commands.add_parser('list', help="List available constants")
+
+    compute = commands.add_parser('compute', help="Compute constants without the GUI")
+    compute.add_argument('names', nargs='*', metavar='name',
+                         help="Constant names as shown in the list")
+    compute.add_argument('-e', '--expression', action='append', default=[], dest='expressions',
+                         help="Also compute an expression such as 'pi^2/6 - 1' (repeatable)")
+    compute.add_argument('-p', '--precision', default="1000", help="Digits (e.g. 100, 1K, 1M)")
+    compute.add_argument('-b', '--backend', choices=['mpmath', 'flint', 'engine'],
+                         help="Force a backend instead of the benchmarked choice")
+    compute.add_argument('-o', '--output',
+                         help="Write the value to a file (a directory for several names)")
+    compute.add_argument('-j', '--jobs', type=int, default=1,
+                         help="Constants computed concurrently, subject to the memory budget")
+    compute.add_argument('--memory-budget',
+                         help=f"Memory budget such as 2G (default: ${MEMORY_BUDGET_ENV} "
+                              "or 80%% of available RAM)")
+    compute.add_argument('--verify', action='store_true',
+                         help="Cross-check with an independent formula run concurrently")
+
+    cf = commands.add_parser('cf', help="Continued fraction of a computed constant")
+    cf.add_argument('name', help="Constant name as shown in the list")
+    cf.add_argument('-p', '--precision', default="10K", help="Digits to compute first")
+    cf.add_argument('-n', '--terms', type=int, help="Stop after this many partial quotients")
+    cf.add_argument('-o', '--output', help="Stream the partial quotients to a file")
+    cf.add_argument('--benchmark', action='store_true',
+                    help="Also time a plain Euclid expansion and check it agrees")
+    cf.add_argument('--memory-budget', help="Memory budget such as 2G")
+
+    analyze = commands.add_parser('analyze', help="Digit statistics of a constant or digit file")
+    analyze.add_argument('name', nargs='?', help="Constant name as shown in the list")
+    analyze.add_argument('-p', '--precision', default="1M", help="Digits to compute first")
+    analyze.add_argument('-f', '--file', help="Analyse a saved digit file instead")
+    analyze.add_argument('-s', '--search', help="Report the positions of a digit string")
+    analyze.add_argument('--block', type=int, default=3, choices=range(1, 7), metavar='K',
+                         help="Block length for the block-frequency test (1-6, default 3)")
+    analyze.add_argument('--memory-budget', help="Memory budget such as 2G")
+
+    codata = commands.add_parser('codata', help="Derived physical constants with uncertainties")
+    codata.add_argument('-p', '--precision', default="30", help="Digits per value")
+    codata.add_argument('--inputs',
+                        help=f"JSON file with updated inputs (default: {CODATA_FILE} if present)")
+
+    identify = commands.add_parser('identify',
+                                   help="Find an integer relation with catalog constants")
+    identify.add_argument('target', help="Constant name, expression, or a value with 40+ digits")
+    identify.add_argument('-p', '--precision', default=str(IDENTIFY_CONFIRM_DPS + 10),
+                          help="Digits to compute a constant or expression to first")
+
+    startup = commands.add_parser('startup', help="Measure GUI time to first paint")
+    startup.add_argument('--budget', type=float, default=STARTUP_BUDGET,
+                         help=f"Exit with status 1 above this many seconds (default {STARTUP_BUDGET})")
+
+    backends = commands.add_parser('backends', help="Show big-number backends")
+    backends.add_argument('--benchmark', action='store_true',
+                          help="Time every backend per constant and precision band")
+    return parser
+
+
+def run_cli(args):
+    constants = load_constants()
+    selector = BackendSelector()
+
+    if args.command == 'list':
+        for name in constants:
+            print(name)
+        return 0
+
+    if args.command == 'backends':
+        print(f"Integer backend: {backend_label('mpmath')}")
+        print(f"python-flint:    {'available' if flint else 'not installed'}")
+        if args.benchmark:
+            def report(name, bound, timings, choice):
+                times = "  ".join(f"{b}={t:.4f}s" if t is not None else f"{b}=stopped"
+                                  for b, t in timings.items())
+                print(f"{name:<36} ≤{bound:>7} digits  {times}  → {choice}")
+            selector.benchmark(constants, report)
+            print(f"Saved to {selector.path}")
+        return 0
+
+    if args.command == 'cf':
+        return _continued_fraction_job(args, constants, selector)
+
+    if args.command == 'analyze':
+        return _analysis_job(args, constants, selector)
+
+    if args.command == 'identify':
+        return _identify_job(args, constants, selector)
+
+    if args.command == 'codata':
+        try:
+            release, inputs = (load_codata_inputs(args.inputs) if args.inputs
+                               else catalog_codata_inputs())
+        except ValueError as e:
+            print(f"⨯ {e}", file=sys.stderr)
+            return 1
+        precision = parse_precision(args.precision)
+        start = time.perf_counter()
+        values = codata_table(working_dps(precision), inputs)
+        relative = codata_uncertainties(inputs)
+        elapsed = time.perf_counter() - start
+        for symbol, value in values.items():
+            name = next((n for n, s in CODATA_SYMBOLS.items() if s == symbol), symbol)
+            print(f"{name:<40} {mp.nstr(value, precision):<{precision + 8}} u_r = {relative[symbol]:.2g}")
+        print(f"# {release} · {len(values)} entries at {precision} digits in {elapsed:.3f} s",
+              file=sys.stderr)
+        return 0
+
+    unknown = [name for name in args.names if name not in constants]
+    if unknown:
+        print(f"Unknown constant: {', '.join(unknown)}", file=sys.stderr)
+        return 1
+    expressions = {}
+    for text in args.expressions:
+        try:
+            name, constant_data = expression_constant(text)
+        except ValueError as e:
+            print(f"⨯ {e}", file=sys.stderr)
+            return 1
+        constants[name] = constant_data
+        expressions[name] = text
+        args.names.append(name)
+    if not args.names:
+        print("Nothing to compute: give constant names or --expression", file=sys.stderr)
+        return 1
+    if len(args.names) > 1 and args.output:
+        os.makedirs(args.output, exist_ok=True)
+
+    governor = ResourceGovernor(parse_size(args.memory_budget) if args.memory_budget else None)
+    output_lock = threading.Lock()
+    jobs = max(1, min(args.jobs, len(args.names)))
+    # Threads only schedule and report; each evaluation gets a fresh process, so
+    # jobs cannot change each other's precision and peak RSS is per job
+    fresh = {'max_tasks_per_child': 1} if sys.version_info >= (3, 11) else {}
+    workers = (ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context('spawn'),
+                                   **fresh)
+               if jobs > 1 else None)
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            codes = list(pool.map(
+                lambda name: _compute_job(name, args, constants, selector, governor,
+                                          output_lock, workers, expressions.get(name)),
+                args.names))
+    finally:
+        if workers:
+            workers.shutdown()
+    return max(codes)
+
+
+def _continued_fraction_job(args, constants, selector):
+    if args.name not in constants:
+        print(f"Unknown constant: {args.name}", file=sys.stderr)
+        return 1
+    precision = parse_precision(args.precision)
+    governor = ResourceGovernor(parse_size(args.memory_budget) if args.memory_budget else None)
+    job = None
+    try:
+        estimate = estimate_job_memory(selector.choose(args.name, precision), precision)
+        job = governor.reserve(estimate, f"{args.name} at {precision:,} digits")
+        value, backend = selector.evaluate(args.name, constants[args.name], precision)
+        if not isinstance(value, mp.mpf):
+            raise ValueError("Continued fractions need a numeric value")
+        stats, expansion = {}, []
+        start = time.perf_counter()
+        with open(args.output, 'w') if args.output else contextlib.nullcontext(sys.stdout) as out:
+            for quotients, stats in continued_fraction(value, precision, args.terms):
+                out.write("\n".join(map(str, quotients)) + "\n")
+                if args.benchmark:
+                    expansion.extend(quotients)
+        elapsed = time.perf_counter() - start
+        print(f"# {args.name} · {backend_label(backend)} · {describe_cf_stats(stats)} · "
+              f"{elapsed:.3f} s", file=sys.stderr)
+        if args.benchmark:
+            start = time.perf_counter()
+            reference = euclid_quotients(value, len(expansion))
+            euclid = time.perf_counter() - start
+            print(f"# Plain Euclid: {euclid:.3f} s for the same quotients "
+                  f"({euclid / max(elapsed, 1e-9):.1f}x the half-gcd time) · "
+                  f"{'identical' if reference == expansion else '⨯ different'}", file=sys.stderr)
+            if reference != expansion:
+                return 2
+    except Exception as e:
+        print(f"⨯ Error: {str(e)}", file=sys.stderr)
+        return 1
+    finally:
+        if job is not None:
+            governor.release(job)
+    return 0
+
+
+def _analysis_job(args, constants, selector):
+    if not args.file and args.name not in constants:
+        print(f"Unknown constant: {args.name}", file=sys.stderr)
+        return 1
+    job = None
+    governor = ResourceGovernor(parse_size(args.memory_budget) if args.memory_budget else None)
+    try:
+        if args.file:
+            buffer = digits_from_file(args.file)
+        else:
+            precision = parse_precision(args.precision)
+            plan = plan_precision(precision, governor.budget, spills_to_disk(args.name))
+            backend = 'engine' if plan['out_of_core'] else None
+            estimate = estimate_job_memory(selector.choose(args.name, precision, backend),
+                                           precision, plan['out_of_core'])
+            job = governor.reserve(estimate, f"{args.name} at {precision:,} digits")
+            with ScratchSpace() if plan['out_of_core'] else contextlib.nullcontext() as scratch:
+                value, backend = selector.evaluate(args.name, constants[args.name], precision,
+                                                   backend, scratch=scratch)
+            if not isinstance(value, mp.mpf):
+                raise ValueError("Digit statistics need a numeric value")
+            if plan['out_of_core']:
+                path = result_path(args.name, precision)
+                write_digits(value, precision, path)
+                buffer = digits_from_file(path)
+            else:
+                buffer = digits_from_text(format_value(value, precision))
+            print(f"# {args.name} · {precision:,} digits · {backend_label(backend)}",
+                  file=sys.stderr)
+        start = time.perf_counter()
+        stats = analyze_digits(buffer, args.search, args.block)
+        print(describe_analysis(stats))
+        print(f"# Analysed in {time.perf_counter() - start:.3f} s", file=sys.stderr)
+    except Exception as e:
+        print(f"⨯ Error: {str(e)}", file=sys.stderr)
+        return 1
+    finally:
+        if job is not None:
+            governor.release(job)
+    return 0
+
+
+def _identify_job(args, constants, selector):
+    target, exclude = args.target, ()
+    try:
+        try:
+            float(target)
+            text = target  # A pasted value
+        except ValueError:
+            if target in constants:
+                name, constant_data, exclude = target, constants[target], (target,)
+            else:
+                name, constant_data = expression_constant(target)
+            precision = parse_precision(args.precision)
+            value, backend = selector.evaluate(name, constant_data, precision)
+            text = format_value(value, precision)
+            print(f"# {name} · {precision:,} digits · {backend_label(backend)}", file=sys.stderr)
+        start = time.perf_counter()
+        result = identify(text, exclude)
+        print(describe_identification(result))
+        print(f"# Searched in {time.perf_counter() - start:.3f} s", file=sys.stderr)
+    except Exception as e:
+        print(f"⨯ Error: {str(e)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _evaluate_job(name, constant_data, selector, precision, backend, out_of_core, output):
+    # Evaluation and formatting of one compute job; the digits are written to
+    # `output` out-of-core and returned as a string otherwise
+    start = time.perf_counter()
+    with ScratchSpace() if out_of_core else contextlib.nullcontext() as scratch:
+        value, backend = selector.evaluate(name, constant_data, precision, backend,
+                                           scratch=scratch)
+    elapsed = time.perf_counter() - start
+    if out_of_core:
+        write_digits(value, precision, output)
+        return None, backend, elapsed
+    return format_value(value, precision), backend, elapsed
+
+
+def _compute_worker(name, expression, precision, backend, out_of_core, output):
+    # Runs in a pool process of its own, which exits after this job
+    constant_data = expression_constant(expression)[1] if expression else load_constants()[name]
+    result = _evaluate_job(name, constant_data, BackendSelector(), precision, backend,
+                           out_of_core, output)
+    return result + (peak_rss(),)
+
+
+def _compute_job(name, args, constants, selector, governor, output_lock, workers=None,
+                 expression=None):
+    def log(text):
+        with output_lock:
+            print(f"# {text}", file=sys.stderr)
+
+    precision = parse_precision(args.precision)
+    label = f"{name} at {precision:,} digits"
+    output = args.output
+    if output and len(args.names) > 1:
+        output = os.path.join(output, os.path.basename(result_path(name, precision)))
+    job = None
+    try:
+        plan = plan_precision(precision, governor.budget, spills_to_disk(name, args.backend))
+        log(f"{name} · {describe_plan(plan)}")
+        verify = args.verify and name in VERIFIERS and not plan['out_of_core']
+        if args.verify and not verify:
+            log(f"No independent formula for {label}; skipping verification")
+        backend = args.backend or ('engine' if plan['out_of_core'] else None)
+        estimate = estimate_job_memory(selector.choose(name, precision, backend), precision,
+                                       plan['out_of_core'], verify)
+        job = governor.try_reserve(estimate, label)
+        if job is None:
+            log(f"Queued {label}: waiting for memory ({governor.describe()})")
+            job = governor.reserve(estimate, label)
+        if plan['out_of_core']:
+            output = output or result_path(name, precision)
+        check = verification_pool().submit(run_verifier, name, precision) if verify else None
+        if workers:
+            result, backend, elapsed, rss = workers.submit(
+                _compute_worker, name, expression, precision, backend,
+                plan['out_of_core'], output).result()
+        else:
+            result, backend, elapsed = _evaluate_job(name, constants[name], selector, precision,
+                                                     backend, plan['out_of_core'], output)
+            rss = governor.peak_rss(job)
+        log(f"{name} · {precision} digits · {backend_label(backend)} · "
+            f"{elapsed:.3f} s · process peak RSS {format_bytes(rss or 0)}")
+
+        if plan['out_of_core']:
+            log(f"Written to {output}")
+            return 0
+
+        if output:
+            with open(output, 'w') as f:
+                f.write(result)
+        else:
+            with output_lock:
+                if len(args.names) > 1:
+                    print(f"=== {name} ===")
+                print(result)
+        if check:
+            meta = compare_results(name, result, check.result())
+            log(f"{name} · {describe_verification(meta)}")
+            if meta['verified_digits'] < meta['total_digits']:
+                return 2
+        return 0
+    except Exception as e:
+        log(f"⨯ Error: {str(e)}")
+        return 1
+    finally:
+        # The digit string and the verifier run count against the budget too
+        if job is not None:
+            governor.release(job)
+
 if __name__ == '__main__':
+    args = build_cli().parse_args() if len(sys.argv) > 1 else None
+    if args and args.command != 'startup':
+        sys.exit(run_cli(args))
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     window = ConstantsApp()
+    if args:
+        sys.exit(measure_startup(app, window, args.budget))
     window.show()
     sys.exit(app.exec())
@@ -0,0 +1,36 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('PyQt6.QtWidgets')
+mpmath = pytest.importorskip('mpmath')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main  # noqa: E402
+
+
+def expand(value, precision, limit=None):
+    return [q for quotients, _ in main.continued_fraction(value, precision, limit)
+            for q in quotients]
+
+
+@pytest.mark.parametrize('digits', [50, 1000, 20000])
+def test_matches_plain_euclid(digits):
+    with mpmath.mp.workdps(main.working_dps(digits)):
+        value = +mpmath.mp.pi
+    quotients = expand(value, digits)
+    assert quotients == main.euclid_quotients(value, len(quotients))
+    assert len(quotients) > 0.8 * digits  # Lochs: ~0.97 quotients per digit
+
+
+def test_negative_values_start_at_the_floor():
+    with mpmath.mp.workdps(40):
+        assert expand(-mpmath.mp.pi, 30, 4) == [-4, 1, 6, 15]
+        assert expand(mpmath.mp.mpf(-2.5), 30)[0] == -3
+
+
+def test_limit():
+    with mpmath.mp.workdps(main.working_dps(10000)):
+        value = +mpmath.mp.e
+    assert expand(value, 10000, 12) == [2, 1, 2, 1, 1, 4, 1, 1, 6, 1, 1, 8]
@@ -0,0 +1,22 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip('PyQt6.QtWidgets')
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'main.py')
+
+
+def test_startup_within_budget_and_defers_backends():
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    # No --budget: the command's own STARTUP_BUDGET decides the exit status
+    result = subprocess.run([sys.executable, MAIN, 'startup'],
+                            capture_output=True, text=True, env=env, timeout=60)
+    assert result.returncode == 0, result.stderr
+    report = dict(line.rsplit(None, 1) for line in result.stdout.splitlines()
+                  if line.startswith(('Catalog entries', 'mpmath at paint', 'Backends at catalog')))
+    assert int(report['Catalog entries']) > 0  # Sampled after the catalog was listed
+    assert report['mpmath at paint'] == 'deferred'
+    assert report['Backends at catalog'] == 'deferred'